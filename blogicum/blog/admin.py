@@ -40,7 +40,9 @@ class PostAdmin(admin.ModelAdmin):
         'location',
         'is_published',
         'pub_date',
-        'created_at'
+        'created_at',
+        'views_count',
+        'trending_score'
     )
     list_editable = (
         'is_published',
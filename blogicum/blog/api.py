@@ -0,0 +1,209 @@
+import base64
+import json
+from datetime import datetime
+
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.files.storage import default_storage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Case, Q, When
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
+
+from blog.constants import API_LIMIT, API_MAX_LIMIT
+from blog.models import Category, Post
+from core.routers import replica_for
+
+POST_FIELDS = {
+    'id': 'id',
+    'title': 'title',
+    'text': 'text',
+    'pub_date': 'pub_date',
+    'updated_at': 'updated_at',
+    'author': 'author__username',
+    'category': 'category__slug',
+    'location': Case(When(location__is_published=True,
+                          then='location__name')),
+    'image': 'image',
+    'comment_count': 'comment_count',
+}
+
+COMMENT_FIELDS = {
+    'id': 'id',
+    'text': 'text',
+    'author': 'author__username',
+    'created_at': 'created_at',
+}
+
+CURSOR_TYPES = (str, int, float)
+
+CATEGORY_FIELDS = {
+    'id': 'id',
+    'slug': 'slug',
+    'title': 'title',
+    'description': 'description',
+}
+
+
+def image_url(name):
+    return default_storage.url(name) if name else None
+
+
+def encode_cursor(values):
+    raw = json.dumps([
+        value.isoformat() if isinstance(value, datetime) else value
+        for value in values
+    ])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor, size):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        raise ValueError('Некорректный курсор.')
+    if not isinstance(values, list) or len(values) != size or not all(
+            isinstance(value, CURSOR_TYPES) and not isinstance(value, bool)
+            for value in values):
+        raise ValueError('Некорректный курсор.')
+    return values
+
+
+def keyset_filter(keys, values, descending):
+    lookup = 'lt' if descending else 'gt'
+    condition = Q()
+    for index, key in enumerate(keys):
+        step = Q(**{f'{key}__{lookup}': values[index]})
+        for previous, value in zip(keys[:index], values):
+            step &= Q(**{previous: value})
+        condition |= step
+    return condition
+
+
+class CursorListView(View):
+    fields = {}
+    default_fields = ()
+    cursor_keys = ('id',)
+    descending = False
+
+    def get_queryset(self):
+        raise ImproperlyConfigured(
+            f'{type(self).__name__}: определите get_queryset().')
+
+    def get_fields(self):
+        requested = self.request.GET.get('fields')
+        if not requested:
+            return self.default_fields or tuple(self.fields)
+        names = tuple(name.strip() for name in requested.split(','))
+        unknown = set(names) - set(self.fields)
+        if unknown:
+            raise ValueError(
+                f'Неизвестные поля: {", ".join(sorted(unknown))}.')
+        return names
+
+    def get_limit(self):
+        try:
+            limit = int(self.request.GET.get('limit', API_LIMIT))
+        except ValueError:
+            raise ValueError('Параметр limit должен быть числом.')
+        return max(1, min(limit, API_MAX_LIMIT))
+
+    def get(self, request, *args, **kwargs):
+        try:
+            names = self.get_fields()
+            limit = self.get_limit()
+            with replica_for(request):
+                queryset = self.get_queryset()
+            queryset = queryset.order_by(*(
+                f'-{key}' if self.descending else key
+                for key in self.cursor_keys
+            ))
+            cursor = request.GET.get('cursor')
+            if cursor:
+                queryset = queryset.filter(keyset_filter(
+                    self.cursor_keys,
+                    decode_cursor(cursor, len(self.cursor_keys)),
+                    self.descending,
+                ))
+        except (ValueError, ValidationError) as error:
+            return JsonResponse({'error': str(error)}, status=400)
+        except Post.DoesNotExist:
+            return JsonResponse({'error': 'Публикация не найдена'},
+                                status=404)
+        with replica_for(request):
+            rows = list(queryset.values_list(
+                *self.cursor_keys, *(self.fields[name] for name in names)
+            )[:limit + 1])
+        return StreamingHttpResponse(
+            self.stream(rows, names, limit),
+            content_type='application/json',
+        )
+
+    def serialize(self, name, value):
+        return value
+
+    def stream(self, rows, names, limit):
+        size = len(self.cursor_keys)
+        encoder = DjangoJSONEncoder(ensure_ascii=False)
+        last = cursor = None
+        yield '{"results": ['
+        for index, row in enumerate(rows):
+            if index == limit:
+                cursor = encode_cursor(last)
+                break
+            item = {
+                name: self.serialize(name, value)
+                for name, value in zip(names, row[size:])
+            }
+            yield (', ' if index else '') + encoder.encode(item)
+            last = row[:size]
+        yield f'], "next": {encoder.encode(cursor)}}}'
+
+
+class PostList(CursorListView):
+    fields = POST_FIELDS
+    default_fields = ('id', 'title', 'pub_date', 'author', 'category',
+                      'location', 'comment_count')
+    cursor_keys = ('pub_date', 'id')
+    descending = True
+
+    def get_queryset(self):
+        queryset = Post.get_published_posts(self)
+        if 'category' in self.request.GET:
+            queryset = queryset.filter(
+                category__slug=self.request.GET['category'])
+        if 'author' in self.request.GET:
+            queryset = queryset.filter(
+                author__username=self.request.GET['author'])
+        return queryset
+
+    def serialize(self, name, value):
+        return image_url(value) if name == 'image' else value
+
+
+class PostItem(View):
+    def get(self, request, post_id):
+        with replica_for(request):
+            post = Post.get_published_posts(self).filter(
+                pk=post_id).values_list(*POST_FIELDS.values()).first()
+        if post is None:
+            return JsonResponse({'error': 'Публикация не найдена'},
+                                status=404)
+        item = dict(zip(POST_FIELDS, post))
+        item['image'] = image_url(item['image'])
+        return JsonResponse(item, json_dumps_params={'ensure_ascii': False})
+
+
+class PostComments(CursorListView):
+    fields = COMMENT_FIELDS
+    cursor_keys = ('created_at', 'id')
+
+    def get_queryset(self):
+        return Post.filtered_objects.get(
+            pk=self.kwargs['post_id']).comments.all()
+
+
+class CategoryList(CursorListView):
+    fields = CATEGORY_FIELDS
+
+    def get_queryset(self):
+        return Category.objects.filter(is_published=True)
@@ -1,7 +1,18 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class BlogConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'blog'
     verbose_name = 'Блог'
+
+    def ready(self):
+        from .models import Category, Comment, Location, Post
+        from .signals import touch_feeds, touch_post
+
+        post_save.connect(touch_post, sender=Comment)
+        post_delete.connect(touch_post, sender=Comment)
+        for model in (Post, Category, Location):
+            post_save.connect(touch_feeds, sender=model)
+            post_delete.connect(touch_feeds, sender=model)
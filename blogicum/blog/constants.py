@@ -1 +1,15 @@
 POSTS_LIMIT = 10
+
+FEED_ITEMS_LIMIT = 20
+
+FEED_CACHE_TIMEOUT = 60 * 60
+
+API_LIMIT = 20
+
+API_MAX_LIMIT = 100
+
+COMMENTS_PLACEHOLDER = '<!-- comments -->'
+
+COMMENTS_STREAM_THRESHOLD = 50
+
+COMMENTS_CHUNK_SIZE = 25
@@ -0,0 +1,130 @@
+import hashlib
+
+from django.contrib.syndication.views import Feed
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.feedgenerator import Atom1Feed
+from django.views.decorators.http import condition
+
+from blog.constants import FEED_CACHE_TIMEOUT, FEED_ITEMS_LIMIT
+from blog.models import Category, Post, User
+from core.routers import replica_for
+
+from .freshness import get_feed_freshness
+
+
+class CachedFeedMixin:
+    def __call__(self, request, *args, **kwargs):
+        with replica_for(request):
+            freshness = get_feed_freshness()
+            if freshness is None:
+                return super().__call__(request, *args, **kwargs)
+            fingerprint, last_modified = freshness
+            etag = hashlib.md5(
+                f'{request.path}:{fingerprint}'.encode()).hexdigest()
+            view = condition(
+                etag_func=lambda *args, **kwargs: etag,
+                last_modified_func=lambda *args, **kwargs: last_modified,
+            )(self.get_cached_response)
+            return view(request, etag, *args, **kwargs)
+
+    def get_cached_response(self, request, etag, *args, **kwargs):
+        key = f'feed:{etag}'
+        cached = cache.get(key)
+        if cached is None:
+            response = super().__call__(request, *args, **kwargs)
+            cached = (response['Content-Type'], response.content)
+            cache.set(key, cached, FEED_CACHE_TIMEOUT)
+        content_type, content = cached
+        return HttpResponse(content, content_type=content_type)
+
+
+class LatestPostsFeed(CachedFeedMixin, Feed):
+    title = 'Блогикум'
+    description = 'Новые публикации'
+
+    def link(self):
+        return reverse('blog:index')
+
+    def items(self):
+        return Post.get_published_posts(self)[:FEED_ITEMS_LIMIT]
+
+    def item_title(self, item):
+        return item.title
+
+    def item_description(self, item):
+        return item.text
+
+    def item_link(self, item):
+        return reverse('blog:post_detail', kwargs={'post_id': item.id})
+
+    def item_pubdate(self, item):
+        return item.pub_date
+
+    def item_updateddate(self, item):
+        return item.updated_at
+
+    def item_author_name(self, item):
+        return item.author.username
+
+    def item_categories(self, item):
+        return (item.category.title,) if item.category else ()
+
+
+class CategoryPostsFeed(LatestPostsFeed):
+    def get_object(self, request, category_slug):
+        return get_object_or_404(
+            Category, slug=category_slug, is_published=True)
+
+    def title(self, obj):
+        return f'Блогикум: {obj.title}'
+
+    def description(self, obj):
+        return obj.description
+
+    def link(self, obj):
+        return reverse('blog:category_posts',
+                       kwargs={'category_slug': obj.slug})
+
+    def items(self, obj):
+        return Post.get_published_posts(self).filter(
+            category=obj)[:FEED_ITEMS_LIMIT]
+
+
+class AuthorPostsFeed(LatestPostsFeed):
+    def get_object(self, request, username):
+        return get_object_or_404(User, username=username)
+
+    def title(self, obj):
+        return f'Блогикум: @{obj.username}'
+
+    def description(self, obj):
+        return f'Публикации пользователя {obj.username}'
+
+    def link(self, obj):
+        return reverse('blog:profile', kwargs={'username': obj.username})
+
+    def items(self, obj):
+        return Post.get_published_posts(self).filter(
+            author=obj)[:FEED_ITEMS_LIMIT]
+
+
+class LatestPostsAtomFeed(LatestPostsFeed):
+    feed_type = Atom1Feed
+    subtitle = LatestPostsFeed.description
+
+
+class CategoryPostsAtomFeed(CategoryPostsFeed):
+    feed_type = Atom1Feed
+
+    def subtitle(self, obj):
+        return self.description(obj)
+
+
+class AuthorPostsAtomFeed(AuthorPostsFeed):
+    feed_type = Atom1Feed
+
+    def subtitle(self, obj):
+        return self.description(obj)
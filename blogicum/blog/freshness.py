@@ -0,0 +1,58 @@
+from django.db.models import Count, Max, Subquery, Sum
+from django.utils import timezone
+
+from blog.models import FeedChange, Post, User
+
+
+def latest(*values):
+    return max((value for value in values if value is not None),
+               default=None)
+
+
+def get_feed_freshness():
+    row = Post.objects.filter(pub_date__lte=timezone.now()).annotate(
+        feeds_changed=Subquery(FeedChange.objects.values('changed_at')[:1]),
+    ).order_by('-pub_date').values_list('pub_date', 'feeds_changed').first()
+    if row is None:
+        return None
+    return ':'.join(map(str, row)), latest(*row)
+
+
+def get_post_freshness(post_id):
+    post = Post.objects.filter(pk=post_id).annotate(
+        comments_count=Count('comments'),
+        comments_updated=Max('comments__created_at'),
+    ).values(
+        'updated_at', 'pub_date', 'comments_count', 'comments_updated',
+        'category__is_published', 'location__name', 'location__is_published',
+        'author__username',
+    ).first()
+    if post is None:
+        return None
+    last_modified = latest(post['updated_at'], post['comments_updated'])
+    fingerprint = ':'.join(str(value) for value in post.values())
+    return fingerprint, last_modified
+
+
+def get_trending_freshness():
+    freshness = get_feed_freshness()
+    if freshness is None:
+        return None
+    scores = Post.objects.filter(trending_score__gt=0).aggregate(
+        scored=Count('id'),
+        total=Sum('trending_score'),
+        top=Max('trending_score'),
+    )
+    return f'{freshness[0]}:{":".join(map(str, scores.values()))}', None
+
+
+def get_profile_freshness(username):
+    profile = User.objects.filter(username=username).values_list(
+        'first_name', 'last_name', 'is_staff').first()
+    if profile is None:
+        return None
+    freshness = get_feed_freshness()
+    if freshness is None:
+        return f'{profile}', None
+    fingerprint, last_modified = freshness
+    return f'{fingerprint}:{profile}', last_modified
@@ -0,0 +1,128 @@
+import asyncio
+import threading
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.template.loader import render_to_string
+from django.urls import Resolver404, resolve
+
+from core import metrics
+
+from .models import Post
+
+
+class CommentBroadcaster:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.listeners = {}
+
+    def subscribe(self, post_id):
+        queue = asyncio.Queue(settings.LIVE_COMMENTS_QUEUE_SIZE)
+        listener = (asyncio.get_running_loop(), queue)
+        with self.lock:
+            self.listeners.setdefault(post_id, set()).add(listener)
+        metrics.incr('live.listeners.subscribed')
+        return listener
+
+    def unsubscribe(self, post_id, listener):
+        with self.lock:
+            listeners = self.listeners.get(post_id, set())
+            listeners.discard(listener)
+            if not listeners:
+                self.listeners.pop(post_id, None)
+
+    def publish(self, post_id, event_id, fragment):
+        with self.lock:
+            listeners = list(self.listeners.get(post_id, ()))
+        for loop, queue in listeners:
+            loop.call_soon_threadsafe(
+                self.deliver, queue, (event_id, fragment))
+        metrics.incr('live.comments.published')
+        return len(listeners)
+
+    @staticmethod
+    def deliver(queue, event):
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            metrics.incr('live.comments.dropped')
+
+
+broadcaster = CommentBroadcaster()
+
+
+def publish_comment(comment):
+    fragment = render_to_string('includes/comment_item.html', {
+        'comment': comment, 'post': comment.post, 'user': None})
+    return broadcaster.publish(comment.post_id, comment.id, fragment)
+
+
+def format_event(event_id, fragment):
+    lines = ''.join(f'data: {line}\n' for line in fragment.splitlines())
+    return f'event: comment\nid: {event_id}\n{lines}\n'.encode()
+
+
+def is_post_visible(post_id):
+    return Post.filtered_objects.filter(pk=post_id).exists()
+
+
+async def stream_comments(post_id, receive, send):
+    if not await sync_to_async(is_post_visible)(post_id):
+        await send({'type': 'http.response.start', 'status': 404,
+                    'headers': [(b'content-type', b'text/plain')]})
+        await send({'type': 'http.response.body'})
+        return
+    listener = broadcaster.subscribe(post_id)
+    next_event = None
+    disconnected = asyncio.ensure_future(wait_for_disconnect(receive))
+    try:
+        await send({'type': 'http.response.start', 'status': 200, 'headers': [
+            (b'content-type', b'text/event-stream; charset=utf-8'),
+            (b'cache-control', b'no-cache'),
+            (b'x-accel-buffering', b'no'),
+        ]})
+        await send({'type': 'http.response.body',
+                    'body': b': connected\n\n', 'more_body': True})
+        _, queue = listener
+        while True:
+            if next_event is None:
+                next_event = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait(
+                (next_event, disconnected),
+                timeout=settings.LIVE_COMMENTS_HEARTBEAT,
+                return_when=asyncio.FIRST_COMPLETED)
+            if disconnected in done:
+                break
+            if next_event in done:
+                body = format_event(*next_event.result())
+                next_event = None
+            else:
+                body = b': ping\n\n'
+            await send({'type': 'http.response.body', 'body': body,
+                        'more_body': True})
+    finally:
+        if next_event is not None:
+            next_event.cancel()
+        disconnected.cancel()
+        broadcaster.unsubscribe(post_id, listener)
+
+
+async def wait_for_disconnect(receive):
+    while (await receive())['type'] != 'http.disconnect':
+        pass
+
+
+class LiveCommentsRouter:
+    def __init__(self, application):
+        self.application = application
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http' and scope['method'] == 'GET':
+            try:
+                match = resolve(scope['path'])
+            except Resolver404:
+                match = None
+            if match is not None and match.view_name == 'blog:comment_stream':
+                await stream_comments(match.kwargs['post_id'], receive, send)
+                return
+        await self.application(scope, receive, send)
@@ -0,0 +1,137 @@
+import csv
+import json
+import os
+import sys
+from contextlib import ExitStack
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+
+from blog.transfer import TRANSFER_MODELS, get_model_fields
+
+
+class Command(BaseCommand):
+    help = ('Потоково выгружает пользователей, категории, местоположения, '
+            'публикации и комментарии в NDJSON (формат фикстур Django) '
+            'или CSV с постоянным расходом памяти.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '-o', '--output', required=True,
+            help='Файл NDJSON ("-" для stdout) или каталог для CSV.')
+        parser.add_argument(
+            '--format', choices=('ndjson', 'csv'), default='ndjson')
+        parser.add_argument(
+            '--models', nargs='+', choices=tuple(TRANSFER_MODELS),
+            default=tuple(TRANSFER_MODELS))
+        parser.add_argument('--chunk-size', type=int, default=2000)
+        parser.add_argument(
+            '--checkpoint',
+            help='Файл контрольной точки для возобновления выгрузки.')
+
+    def handle(self, *args, **options):
+        self.checkpoint_path = options['checkpoint']
+        self.checkpoint = self.load_checkpoint()
+        self.streams = {}
+        if options['format'] == 'csv' and options['output'] == '-':
+            raise CommandError('Для CSV укажите каталог в --output.')
+        with ExitStack() as stack:
+            for name in options['models']:
+                path, stream = self.open_stream(
+                    stack, name, options['format'], options['output'])
+                exported = self.export_model(
+                    name, path, stream, options['format'],
+                    options['chunk_size'])
+                self.stderr.write(f'{name}: {exported}')
+
+    def load_checkpoint(self):
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, encoding='utf-8') as file:
+                return json.load(file)
+        return {'last_pk': {}, 'offset': {}}
+
+    def save_checkpoint(self):
+        if not self.checkpoint_path:
+            return
+        tmp_path = f'{self.checkpoint_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.checkpoint, file)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def open_stream(self, stack, name, export_format, output):
+        if export_format == 'csv':
+            os.makedirs(output, exist_ok=True)
+            path = os.path.join(output, f'{name}.csv')
+        elif output == '-':
+            return None, sys.stdout
+        else:
+            path = output
+        if path not in self.streams:
+            resuming = bool(self.checkpoint['last_pk'])
+            stream = stack.enter_context(open(
+                path, 'a' if resuming else 'w', encoding='utf-8',
+                newline=''))
+            if resuming:
+                offset = self.checkpoint['offset'].get(path, 0)
+                stream.truncate(offset)
+                stream.seek(offset)
+            self.streams[path] = stream
+        return path, self.streams[path]
+
+    def export_model(self, name, path, stream, export_format, chunk_size):
+        model = TRANSFER_MODELS[name]
+        fields = get_model_fields(model)
+        label = model._meta.label_lower
+        write = (
+            self.writer_csv(stream, fields) if export_format == 'csv'
+            else self.writer_ndjson(stream, label, fields)
+        )
+        queryset = model.objects.order_by('pk').values_list(
+            'pk', *(attname for _, attname in fields))
+        last_pk = self.checkpoint['last_pk'].get(label, 0)
+        exported = 0
+        while True:
+            count = 0
+            for row in queryset.filter(pk__gt=last_pk)[:chunk_size].iterator(
+                    chunk_size=chunk_size):
+                write(row)
+                last_pk = row[0]
+                count += 1
+            if not count:
+                break
+            exported += count
+            stream.flush()
+            self.checkpoint['last_pk'][label] = last_pk
+            if path is not None:
+                self.checkpoint['offset'][path] = stream.tell()
+            self.save_checkpoint()
+        return exported
+
+    @staticmethod
+    def writer_ndjson(stream, label, fields):
+        encoder = DjangoJSONEncoder(ensure_ascii=False)
+        names = [name for name, _ in fields]
+
+        def write(row):
+            stream.write(encoder.encode({
+                'model': label,
+                'pk': row[0],
+                'fields': dict(zip(names, row[1:])),
+            }))
+            stream.write('\n')
+        return write
+
+    @staticmethod
+    def writer_csv(stream, fields):
+        writer = csv.writer(stream)
+        if not stream.tell():
+            writer.writerow(['pk', *(name for name, _ in fields)])
+
+        def write(row):
+            writer.writerow([
+                value.isoformat() if isinstance(value, datetime)
+                else '' if value is None else value
+                for value in row
+            ])
+        return write
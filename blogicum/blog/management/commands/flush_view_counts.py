@@ -0,0 +1,28 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from blog.viewcounts import flush_spool
+
+
+class Command(BaseCommand):
+    help = ('Переносит накопленные в спул-файле просмотры публикаций '
+            'в базу данных одной транзакцией.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop', action='store_true',
+            help='Работать непрерывно, сбрасывая просмотры каждые '
+                 '--interval секунд.')
+        parser.add_argument('--interval', type=float,
+                            default=settings.VIEW_COUNTS_FLUSH_INTERVAL)
+
+    def handle(self, *args, **options):
+        while True:
+            flushed = flush_spool()
+            if flushed or not options['loop']:
+                self.stdout.write(f'обновлено публикаций: {flushed}')
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,184 @@
+import random
+import time
+from datetime import timedelta
+from itertools import accumulate
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from faker import Faker
+
+from blog.models import Category, Comment, Location, Post, User
+from blog.transfer import insert_raw, rebuild_derived_data
+
+TEXT_POOL_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = ('Генерирует синтетические данные для нагрузочного '
+            'тестирования: пользователей, категории, местоположения, '
+            'публикации (включая отложенные и снятые с публикации) и '
+            'комментарии с неравномерным распределением по постам.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100)
+        parser.add_argument('--categories', type=int, default=10)
+        parser.add_argument('--locations', type=int, default=50)
+        parser.add_argument('--posts', type=int, default=10000)
+        parser.add_argument('--comments', type=int, default=50000)
+        parser.add_argument('--days', type=int, default=365,
+                            help='Глубина истории публикаций в днях.')
+        parser.add_argument('--future-ratio', type=float, default=0.05)
+        parser.add_argument('--unpublished-ratio', type=float, default=0.05)
+        parser.add_argument('--skew', type=float, default=1.1,
+                            help='Показатель распределения Ципфа для '
+                                 'комментариев по постам.')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int)
+
+    def handle(self, *args, **options):
+        for name in ('users', 'categories', 'batch_size'):
+            if options[name] < 1:
+                raise CommandError(
+                    f'--{name.replace("_", "-")} должно быть не меньше 1.')
+        self.random = random.Random(options['seed'])
+        self.fake = Faker('ru_RU')
+        self.fake.seed_instance(options['seed'])
+        self.batch_size = options['batch_size']
+        self.now = timezone.now()
+        self.sentences = [
+            self.fake.sentence() for _ in range(TEXT_POOL_SIZE)]
+        self.paragraphs = [
+            self.fake.paragraph(nb_sentences=8)
+            for _ in range(TEXT_POOL_SIZE)
+        ]
+        started = time.perf_counter()
+        with transaction.atomic():
+            users = self.create_users(options['users'])
+            categories = self.create_categories(options['categories'])
+            locations = self.create_locations(options['locations'])
+            posts = self.create_posts(
+                options['posts'], users, categories, locations, options)
+            self.create_comments(
+                options['comments'], users, posts, options['skew'])
+        rebuild_derived_data()
+        self.stdout.write(
+            f'Готово за {time.perf_counter() - started:.1f} с')
+
+    def bulk_create(self, model, objects):
+        start = model.objects.order_by('-pk').values_list(
+            'pk', flat=True).first() or 0
+        batch = []
+        for obj in objects:
+            batch.append(obj)
+            if len(batch) >= self.batch_size:
+                insert_raw(model, batch)
+                batch = []
+        insert_raw(model, batch)
+        ids = list(model.objects.filter(pk__gt=start).order_by(
+            'pk').values_list('pk', flat=True))
+        self.stdout.write(f'{model._meta.verbose_name_plural}: {len(ids)}')
+        return ids
+
+    def past(self, days):
+        return self.now - timedelta(seconds=self.random.uniform(
+            0, days * 24 * 60 * 60))
+
+    def create_users(self, count):
+        password = make_password(None)
+        suffix = int(self.now.timestamp())
+        return self.bulk_create(User, (
+            User(
+                username=f'user{suffix}_{index}',
+                first_name=self.fake.first_name(),
+                last_name=self.fake.last_name(),
+                email=f'user{suffix}_{index}@example.com',
+                password=password,
+                date_joined=self.past(3 * 365),
+            )
+            for index in range(count)
+        ))
+
+    def create_categories(self, count):
+        suffix = int(self.now.timestamp())
+        return self.bulk_create(Category, (
+            Category(
+                title=self.fake.word().capitalize(),
+                description=self.random.choice(self.sentences),
+                slug=f'category-{suffix}-{index}',
+                is_published=self.random.random() > 0.1,
+                created_at=self.past(3 * 365),
+            )
+            for index in range(count)
+        ))
+
+    def create_locations(self, count):
+        return self.bulk_create(Location, (
+            Location(
+                name=self.fake.city(),
+                is_published=self.random.random() > 0.1,
+                created_at=self.past(3 * 365),
+            )
+            for _ in range(count)
+        ))
+
+    def create_posts(self, count, users, categories, locations, options):
+        pub_dates = []
+
+        def build():
+            for _ in range(count):
+                if self.random.random() < options['future_ratio']:
+                    pub_date = self.now + timedelta(
+                        days=self.random.uniform(0, 30))
+                else:
+                    pub_date = self.past(options['days'])
+                created_at = min(pub_date, self.now)
+                pub_dates.append(pub_date)
+                yield Post(
+                    title=self.random.choice(self.sentences)[:256],
+                    text=self.random.choice(self.paragraphs),
+                    pub_date=pub_date,
+                    created_at=created_at,
+                    updated_at=created_at,
+                    is_published=(
+                        self.random.random() >= options['unpublished_ratio']
+                    ),
+                    author_id=self.random.choice(users),
+                    category_id=self.random.choice(categories),
+                    location_id=(
+                        self.random.choice(locations)
+                        if locations and self.random.random() > 0.2 else None
+                    ),
+                )
+
+        ids = self.bulk_create(Post, build())
+        return list(zip(ids, pub_dates))
+
+    def create_comments(self, count, users, posts, skew):
+        if not posts:
+            return []
+        ranked = posts[:]
+        self.random.shuffle(ranked)
+        weights = accumulate(
+            1 / rank ** skew for rank in range(1, len(ranked) + 1))
+        cum_weights = list(weights)
+
+        def build():
+            remaining = count
+            while remaining > 0:
+                size = min(self.batch_size, remaining)
+                remaining -= size
+                targets = self.random.choices(
+                    ranked, cum_weights=cum_weights, k=size)
+                for post_id, pub_date in targets:
+                    created_at = min(pub_date, self.now) + timedelta(
+                        seconds=self.random.expovariate(1 / 86400))
+                    yield Comment(
+                        text=self.random.choice(self.sentences),
+                        post_id=post_id,
+                        author_id=self.random.choice(users),
+                        created_at=min(created_at, self.now),
+                    )
+
+        return self.bulk_create(Comment, build())
@@ -0,0 +1,113 @@
+import time
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+
+from blog.transfer import (TRANSFER_MODELS, get_timestamp_fields,
+                           insert_raw, iter_records, rebuild_derived_data)
+
+
+class Command(BaseCommand):
+    help = ('Быстро загружает фикстуры Django (JSON) или NDJSON из '
+            'export_content пакетными вставками с отложенной проверкой '
+            'внешних ключей.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+')
+        parser.add_argument(
+            '--models', nargs='+', choices=tuple(TRANSFER_MODELS),
+            default=tuple(TRANSFER_MODELS))
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument(
+            '--ignore-conflicts', action='store_true',
+            help='Пропускать записи, уже существующие в базе.')
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        self.using = options['database']
+        self.batch_size = options['batch_size']
+        self.ignore_conflicts = options['ignore_conflicts']
+        self.models = {
+            TRANSFER_MODELS[name]._meta.label_lower: TRANSFER_MODELS[name]
+            for name in options['models']
+        }
+        self.timestamp_fields = {
+            model: set(get_timestamp_fields(model))
+            for model in self.models.values()
+        }
+        self.buffers = defaultdict(list)
+        self.m2m_rows = defaultdict(list)
+        self.counts = defaultdict(int)
+        skipped = defaultdict(int)
+        started = time.perf_counter()
+        connection = connections[self.using]
+        with transaction.atomic(using=self.using):
+            with connection.constraint_checks_disabled():
+                for path in options['paths']:
+                    for record in iter_records(path):
+                        model = self.models.get(record['model'])
+                        if model is None:
+                            skipped[record['model']] += 1
+                            continue
+                        self.add(model, record)
+                self.flush_all()
+            connection.check_constraints(table_names=[
+                model._meta.db_table for model in self.models.values()
+            ])
+            self.reset_sequences(connection)
+        rebuild_derived_data()
+        for label, count in self.counts.items():
+            self.stdout.write(f'{label}: {count}')
+        for label, count in skipped.items():
+            self.stderr.write(f'{label}: пропущено {count}')
+        self.stdout.write(
+            f'Загрузка заняла {time.perf_counter() - started:.1f} с')
+
+    def add(self, model, record):
+        values = {}
+        for name, value in record['fields'].items():
+            field = model._meta.get_field(name)
+            if field.many_to_many:
+                self.add_m2m(field, record['pk'], value)
+            elif field.is_relation:
+                values[field.attname] = value
+            else:
+                values[field.attname] = field.to_python(value)
+        for attname in self.timestamp_fields[model] - values.keys():
+            values[attname] = timezone.now()
+        buffer = self.buffers[model]
+        buffer.append(model(pk=record['pk'], **values))
+        if len(buffer) >= self.batch_size:
+            self.flush(model)
+
+    def add_m2m(self, field, pk, related_pks):
+        through = field.remote_field.through
+        for related_pk in related_pks:
+            self.m2m_rows[through].append(through(**{
+                f'{field.m2m_field_name()}_id': pk,
+                f'{field.m2m_reverse_field_name()}_id': related_pk,
+            }))
+
+    def flush(self, model):
+        batch = self.buffers.pop(model, [])
+        if batch:
+            insert_raw(model, batch, self.using, self.ignore_conflicts)
+            self.counts[model._meta.label_lower] += len(batch)
+
+    def flush_all(self):
+        for model in list(self.buffers):
+            self.flush(model)
+        for through, rows in self.m2m_rows.items():
+            through.objects.using(self.using).bulk_create(
+                rows, batch_size=self.batch_size,
+                ignore_conflicts=self.ignore_conflicts)
+
+    def reset_sequences(self, connection):
+        statements = connection.ops.sequence_reset_sql(
+            no_style(), list(self.models.values()))
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
@@ -0,0 +1,29 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from blog.trending import update_trending
+
+
+class Command(BaseCommand):
+    help = ('Пересчитывает рейтинг популярности публикаций по скорости '
+            'комментирования и возрасту. Затрагивает только публикации '
+            'с новыми комментариями и уже попавшие в рейтинг.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop', action='store_true',
+            help='Работать непрерывно, пересчитывая рейтинг каждые '
+                 '--interval секунд.')
+        parser.add_argument('--interval', type=float, default=60.0)
+
+    def handle(self, *args, **options):
+        while True:
+            started = time.perf_counter()
+            updated = update_trending()
+            self.stdout.write(
+                f'обновлено {updated} за '
+                f'{(time.perf_counter() - started) * 1000:.1f} ms')
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,46 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from blog.warmup import get_warmup_urls, warm_cache
+
+
+class Command(BaseCommand):
+    help = ('Прогревает кэш страниц после деплоя или сброса кэша: '
+            'первые страницы лент, категорий и самые просматриваемые '
+            'публикации параллельно запрашиваются у запущенного сервера, '
+            'чтобы страницы попали в кэш его процессов. При кэше в памяти '
+            'процесса (LocMemCache) прогревается только воркер, '
+            'принявший запрос; для общего прогрева нужен общий кэш.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default=settings.CACHE_WARMUP_URL,
+                            help='Адрес запущенного сервера.')
+        parser.add_argument('--pages', type=int,
+                            default=settings.CACHE_WARMUP_PAGES)
+        parser.add_argument('--posts', type=int,
+                            default=settings.CACHE_WARMUP_POSTS)
+        parser.add_argument('--workers', type=int,
+                            default=settings.CACHE_WARMUP_WORKERS)
+
+    def handle(self, *args, **options):
+        urls = get_warmup_urls(options['pages'], options['posts'])
+        started = time.perf_counter()
+        results = warm_cache(options['url'], urls, options['workers'])
+        elapsed = time.perf_counter() - started
+        for url, status, seconds in results:
+            if status != 200:
+                self.stderr.write(f'{status} {url}')
+            elif options['verbosity'] > 1:
+                self.stdout.write(f'{seconds * 1000:8.1f} ms  {url}')
+        timings = sorted(seconds for _, _, seconds in results)
+        if not timings:
+            self.stdout.write('Нет страниц для прогрева.')
+            return
+        warmed = sum(status == 200 for _, status, _ in results)
+        self.stdout.write(
+            f'Прогрето страниц: {warmed} из {len(results)} '
+            f'за {elapsed:.2f} с, '
+            f'медиана {timings[len(timings) // 2] * 1000:.1f} ms, '
+            f'максимум {timings[-1] * 1000:.1f} ms')
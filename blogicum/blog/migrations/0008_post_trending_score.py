@@ -0,0 +1,18 @@
+# Generated by Django 3.2.16 on 2026-10-19 08:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0007_post_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='trending_score',
+            field=models.FloatField(db_index=True, default=0, editable=False, verbose_name='Рейтинг популярности'),
+        ),
+    ]
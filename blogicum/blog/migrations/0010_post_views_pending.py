@@ -0,0 +1,18 @@
+# Generated by Django 3.2.16 on 2026-10-19 08:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_post_views_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='views_pending',
+            field=models.BooleanField(db_index=True, default=False, editable=False, verbose_name='Просмотры не учтены в рейтинге'),
+        ),
+    ]
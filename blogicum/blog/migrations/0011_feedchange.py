@@ -0,0 +1,24 @@
+# Generated by Django 3.2.16 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0010_post_views_pending'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('changed_at', models.DateTimeField(verbose_name='Изменено')),
+            ],
+            options={
+                'verbose_name': 'изменение лент',
+                'verbose_name_plural': 'Изменения лент',
+            },
+        ),
+    ]
@@ -51,12 +51,28 @@ class Post(PublishedModel):
     title = models.CharField(max_length=256, verbose_name='Заголовок')
     text = models.TextField(verbose_name='Текст')
     pub_date = models.DateTimeField(
+        db_index=True,
         verbose_name='Дата и время публикации',
         help_text='Если установить дату и время в будущем'
                   ' — можно делать отложенные публикации.')
     image = models.ImageField('Изображение',
                               upload_to=settings.POST_IMAGES_UPLOAD_FOLDER,
                               blank=True)
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='Изменено')
+    trending_score = models.FloatField(
+        default=0,
+        db_index=True,
+        editable=False,
+        verbose_name='Рейтинг популярности')
+    views_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Просмотры')
+    views_pending = models.BooleanField(
+        default=False,
+        db_index=True,
+        editable=False,
+        verbose_name='Просмотры не учтены в рейтинге')
     author = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -107,6 +123,17 @@ class Post(PublishedModel):
         return self.title
 
 
+class FeedChange(models.Model):
+    changed_at = models.DateTimeField(verbose_name='Изменено')
+
+    class Meta:
+        verbose_name = 'изменение лент'
+        verbose_name_plural = 'Изменения лент'
+
+    def __str__(self):
+        return str(self.changed_at)
+
+
 class Comment(models.Model):
     text = models.TextField('Текст комментария')
     post = models.ForeignKey(
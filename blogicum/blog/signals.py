@@ -0,0 +1,13 @@
+from django.utils import timezone
+
+from .models import FeedChange, Post
+
+
+def touch_post(sender, instance, **kwargs):
+    Post.objects.filter(pk=instance.post_id).update(updated_at=timezone.now())
+    touch_feeds(sender)
+
+
+def touch_feeds(sender, **kwargs):
+    FeedChange.objects.update_or_create(
+        pk=1, defaults={'changed_at': timezone.now()})
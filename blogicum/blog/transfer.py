@@ -0,0 +1,100 @@
+import json
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from blog.models import Category, Comment, Location, Post
+from blog.signals import touch_feeds
+from blog.trending import update_trending
+
+TRANSFER_MODELS = {
+    'users': get_user_model(),
+    'categories': Category,
+    'locations': Location,
+    'posts': Post,
+    'comments': Comment,
+}
+
+READ_SIZE = 64 * 1024
+
+TIMESTAMP_FLAGS = ('auto_now', 'auto_now_add')
+
+
+def get_timestamp_fields(model):
+    return [
+        field.attname
+        for field in model._meta.concrete_fields
+        if any(getattr(field, flag, False) for flag in TIMESTAMP_FLAGS)
+    ]
+
+
+def insert_raw(model, objects, using=DEFAULT_DB_ALIAS,
+               ignore_conflicts=False):
+    if not objects:
+        return
+    fields = [
+        field for field in model._meta.concrete_fields
+        if not (field.primary_key and objects[0].pk is None)
+    ]
+    batch_size = max(
+        connections[using].ops.bulk_batch_size(fields, objects), 1)
+    for start in range(0, len(objects), batch_size):
+        model._base_manager._insert(
+            objects[start:start + batch_size], fields, using=using,
+            raw=True, ignore_conflicts=ignore_conflicts)
+
+
+def get_model_fields(model):
+    return [
+        (field.name, field.attname)
+        for field in model._meta.concrete_fields
+        if not field.primary_key
+    ]
+
+
+def iter_json_array(file):
+    decoder = json.JSONDecoder()
+    buffer, eof, started = '', False, False
+    while True:
+        buffer = buffer.lstrip()
+        if not started and buffer.startswith('['):
+            buffer, started = buffer[1:], True
+            continue
+        if started and buffer.startswith(','):
+            buffer = buffer[1:]
+            continue
+        if started and buffer.startswith(']'):
+            return
+        try:
+            record, end = decoder.raw_decode(buffer)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            chunk = file.read(READ_SIZE)
+            eof = not chunk
+            buffer += chunk
+            continue
+        yield record
+        buffer = buffer[end:]
+
+
+def iter_ndjson(file):
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def iter_records(path):
+    with open(path, encoding='utf-8') as file:
+        head = file.read(READ_SIZE).lstrip()[:1]
+        file.seek(0)
+        if head == '[':
+            yield from iter_json_array(file)
+        else:
+            yield from iter_ndjson(file)
+
+
+def rebuild_derived_data():
+    touch_feeds(Post)
+    cache.clear()
+    update_trending()
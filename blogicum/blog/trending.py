@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from core import metrics
+
+from .models import Post
+
+
+def get_trending_score(recent_comments, views, age):
+    hours = max(age.total_seconds() / 3600, 0)
+    score = (recent_comments + views * settings.TRENDING_VIEW_WEIGHT) / (
+        hours + 2) ** settings.TRENDING_GRAVITY
+    return score if score >= settings.TRENDING_MIN_SCORE else 0
+
+
+def update_trending(now=None):
+    now = now or timezone.now()
+    window_start = now - timedelta(hours=settings.TRENDING_WINDOW_HOURS)
+    viewed = list(Post.objects.filter(
+        views_pending=True).values_list('pk', flat=True))
+    Post.objects.filter(pk__in=viewed).update(views_pending=False)
+    candidates = Post.objects.filter(
+        Q(trending_score__gt=0) | Q(comments__created_at__gte=window_start)
+        | Q(pk__in=viewed))
+    posts = Post.objects.filter(
+        pk__in=candidates.values('pk')
+    ).annotate(recent_comments=Count(
+        'comments', filter=Q(comments__created_at__gte=window_start)
+    )).only('pk', 'pub_date', 'views_count', 'trending_score')
+    changed = []
+    for post in posts:
+        score = get_trending_score(
+            post.recent_comments, post.views_count, now - post.pub_date)
+        if score != post.trending_score:
+            post.trending_score = score
+            changed.append(post)
+    with transaction.atomic():
+        Post.objects.bulk_update(changed, ['trending_score'],
+                                 batch_size=settings.TRENDING_BATCH_SIZE)
+    metrics.incr('trending.updated', len(changed))
+    return len(changed)
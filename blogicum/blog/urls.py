@@ -1,16 +1,23 @@
 from django.urls import path
 
-from . import views
+from . import api, feeds, views
 
 app_name = 'blog'
 
 
 urlpatterns = [
     path('', views.Homepage.as_view(), name='index'),
+    path('popular/', views.PopularPosts.as_view(), name='popular'),
+    path('feed/rss/', feeds.LatestPostsFeed(), name='feed_rss'),
+    path('feed/atom/', feeds.LatestPostsAtomFeed(), name='feed_atom'),
     path('edit_profile/', views.EditUserProfile.as_view(),
          name='edit_profile'),
     path('profile/<slug:username>/', views.UserInfoPage.as_view(),
          name='profile'),
+    path('profile/<slug:username>/feed/rss/', feeds.AuthorPostsFeed(),
+         name='profile_feed_rss'),
+    path('profile/<slug:username>/feed/atom/', feeds.AuthorPostsAtomFeed(),
+         name='profile_feed_atom'),
     path('posts/create/', views.CreatePost.as_view(), name='create_post'),
     path('posts/<int:post_id>/', views.PostDetail.as_view(),
          name='post_detail'),
@@ -20,10 +27,23 @@ urlpatterns = [
          name='delete_post'),
     path('posts/<int:post_id>/comment/', views.LeaveComment.as_view(),
          name='add_comment'),
+    path('posts/<int:post_id>/comments/stream/',
+         views.CommentStream.as_view(), name='comment_stream'),
     path('posts/<int:post_id>/edit_comment/<int:comment_id>/',
          views.EditComment.as_view(), name='edit_comment'),
     path('posts/<int:post_id>/delete_comment/<int:comment_id>/',
          views.DeleteComment.as_view(), name='delete_comment'),
     path('category/<slug:category_slug>/', views.CategoryPosts.as_view(),
          name='category_posts'),
+    path('category/<slug:category_slug>/feed/rss/',
+         feeds.CategoryPostsFeed(), name='category_feed_rss'),
+    path('category/<slug:category_slug>/feed/atom/',
+         feeds.CategoryPostsAtomFeed(), name='category_feed_atom'),
+    path('api/posts/', api.PostList.as_view(), name='api_posts'),
+    path('api/posts/<int:post_id>/', api.PostItem.as_view(),
+         name='api_post'),
+    path('api/posts/<int:post_id>/comments/', api.PostComments.as_view(),
+         name='api_post_comments'),
+    path('api/categories/', api.CategoryList.as_view(),
+         name='api_categories'),
 ]
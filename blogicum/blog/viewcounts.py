@@ -0,0 +1,120 @@
+import atexit
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.db.models import F
+
+from core import metrics
+
+from .models import Post
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def locked_spool(blocking=True):
+    with open(settings.VIEW_COUNTS_SPOOL, 'a+', encoding='ascii') as spool:
+        if fcntl is not None:
+            flags = fcntl.LOCK_EX
+            if not blocking:
+                flags |= fcntl.LOCK_NB
+            try:
+                fcntl.flock(spool, flags)
+            except BlockingIOError:
+                spool = None
+        yield spool
+
+
+def write_spool(counts):
+    if not counts:
+        return
+    with locked_spool() as spool:
+        spool.write(''.join(
+            f'{post_id} {count}\n' for post_id, count in counts.items()))
+
+
+def read_spool(spool):
+    spool.seek(0)
+    counts = Counter()
+    for line in spool:
+        post_id, count = line.split()
+        counts[int(post_id)] += int(count)
+    return counts
+
+
+def apply_counts(counts):
+    by_increment = defaultdict(list)
+    for post_id, count in counts.items():
+        by_increment[count].append(post_id)
+    with transaction.atomic():
+        for count, post_ids in by_increment.items():
+            Post.objects.filter(pk__in=post_ids).update(
+                views_count=F('views_count') + count, views_pending=True)
+
+
+def flush_spool():
+    with locked_spool(blocking=False) as spool:
+        if spool is None:
+            return 0
+        counts = read_spool(spool)
+        if counts:
+            apply_counts(counts)
+            spool.truncate(0)
+    metrics.incr('views.flushed', sum(counts.values()))
+    return len(counts)
+
+
+class ViewCountBuffer:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = Counter()
+        self.flushed_at = time.monotonic()
+        self.spools_at_exit = False
+
+    def drain(self):
+        with self.lock:
+            counts, self.counts = self.counts, Counter()
+            self.flushed_at = time.monotonic()
+        return counts
+
+    def add(self, post_id):
+        with self.lock:
+            if not self.spools_at_exit:
+                atexit.register(self.spool)
+                self.spools_at_exit = True
+            self.counts[post_id] += 1
+            due = (time.monotonic() - self.flushed_at
+                   >= settings.VIEW_COUNTS_FLUSH_INTERVAL)
+        if not due:
+            return
+        try:
+            self.flush()
+        except (OSError, DatabaseError):
+            metrics.incr('views.flush_failed')
+            logger.exception('Не удалось сбросить счётчики просмотров.')
+
+    def spool(self):
+        counts = self.drain()
+        try:
+            write_spool(counts)
+        except OSError:
+            with self.lock:
+                self.counts.update(counts)
+            raise
+
+    def flush(self):
+        self.spool()
+        return flush_spool()
+
+
+buffer = ViewCountBuffer()
@@ -1,15 +1,28 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import Http404
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect
+from django.template.loader import get_template, render_to_string
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone
 from django.views.generic import (CreateView, DeleteView, DetailView, ListView,
-                                  UpdateView)
+                                  UpdateView, View)
 
-from blog.constants import POSTS_LIMIT
+from blog.constants import (COMMENTS_CHUNK_SIZE, COMMENTS_PLACEHOLDER,
+                            COMMENTS_STREAM_THRESHOLD, POSTS_LIMIT)
 from blog.models import Category, Comment, Post, User
+from core.mixins import (ConditionalGetMixin, PrimaryStickyMixin,
+                         ReadReplicaMixin, StaleWhileRevalidateMixin)
+from core.ratelimit import RateLimitMixin
+from core.routers import replica_for
 
 from .forms import CommentForm, PostForm, UserForm
+from .freshness import (get_feed_freshness, get_post_freshness,
+                        get_profile_freshness, get_trending_freshness)
+from .live import publish_comment
+from .viewcounts import buffer as view_counts
+from .warmup import is_warmup_request
 
 
 class PostModelMixin:
@@ -50,18 +63,39 @@ class AllPostsMixin:
         return Post.get_all_posts(self)
 
 
-class Homepage(PostModelMixin, PublishedPostsMixin, ListView):
+class Homepage(ReadReplicaMixin, ConditionalGetMixin,
+               StaleWhileRevalidateMixin, PostModelMixin, PublishedPostsMixin,
+               ListView):
     template_name = 'blog/index.html'
 
+    def get_freshness(self):
+        return get_feed_freshness()
+
     def get_queryset(self):
         return self.get_published_posts_queryset()
 
 
-class UserInfoPage(PostModelMixin, AllPostsMixin,
+class PopularPosts(ReadReplicaMixin, ConditionalGetMixin,
+                   StaleWhileRevalidateMixin, PostModelMixin,
                    PublishedPostsMixin, ListView):
+    template_name = 'blog/popular.html'
+
+    def get_freshness(self):
+        return get_trending_freshness()
+
+    def get_queryset(self):
+        return self.get_published_posts_queryset().filter(
+            trending_score__gt=0).order_by('-trending_score', '-pub_date')
+
+
+class UserInfoPage(ReadReplicaMixin, ConditionalGetMixin, PostModelMixin,
+                   AllPostsMixin, PublishedPostsMixin, ListView):
     template_name = 'blog/profile.html'
     author = None
 
+    def get_freshness(self):
+        return get_profile_freshness(self.kwargs['username'])
+
     def get_queryset(self):
         username = self.kwargs['username']
         self.author = get_object_or_404(User, username=username)
@@ -76,7 +110,9 @@ class UserInfoPage(PostModelMixin, AllPostsMixin,
         )
 
 
-class CreatePost(PostFormMixin, LoginRequiredMixin, CreateView):
+class CreatePost(PrimaryStickyMixin, PostFormMixin, LoginRequiredMixin,
+                 RateLimitMixin, CreateView):
+    rate_limit_scope = 'post'
 
     def form_valid(self, form):
         form.instance.author = self.request.user
@@ -87,32 +123,65 @@ class CreatePost(PostFormMixin, LoginRequiredMixin, CreateView):
                        kwargs={'username': self.request.user.username})
 
 
-class PostDetail(PostModelMixin, DetailView):
+class PostDetail(ReadReplicaMixin, ConditionalGetMixin, PostModelMixin,
+                 DetailView):
     template_name = 'blog/detail.html'
     pk_url_kwarg = 'post_id'
-    post = None
 
-    def dispatch(self, request, *args, **kwargs):
-        self.post = get_object_or_404(Post, pk=self.kwargs['post_id'])
-        if self.post.author != self.request.user:
-            if not (self.post.is_published and self.post.category.is_published
-                    and self.post.pub_date <= timezone.now()):
+    def get_freshness(self):
+        return get_post_freshness(self.kwargs['post_id'])
+
+    def get_object(self, queryset=None):
+        post = super().get_object(queryset)
+        if post.author != self.request.user:
+            if not (post.is_published and post.category.is_published
+                    and post.pub_date <= timezone.now()):
                 raise Http404('Публикация не найдена')
-        return super().dispatch(request, *args, **kwargs)
+        if not is_warmup_request(self.request):
+            view_counts.add(post.pk)
+        return post
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['form'] = CommentForm()
-        context['comments'] = self.object.comments.all()
+        context['comments'] = self.object.comments.select_related('author')
         return context
 
-
-class EditPost(PostFormMixin, WhileUpdateDeleteMixin,
+    def render_to_response(self, context, **response_kwargs):
+        if context['comments'].count() < COMMENTS_STREAM_THRESHOLD:
+            return super().render_to_response(context, **response_kwargs)
+        context['stream_comments'] = True
+        head, tail = render_to_string(
+            self.template_name, context, self.request
+        ).split(COMMENTS_PLACEHOLDER, 1)
+        comments = context['comments'].iterator(chunk_size=COMMENTS_CHUNK_SIZE)
+        if isinstance(self.request, ASGIRequest):
+            comments = list(comments)
+        return StreamingHttpResponse(
+            self.stream_comments(head, comments, tail))
+
+    def stream_comments(self, head, comments, tail):
+        yield head
+        template = get_template('includes/comment_item.html')
+        context = {'post': self.object, 'user': self.request.user}
+        chunk = []
+        with replica_for(self.request):
+            for comment in comments:
+                chunk.append(template.render(dict(context, comment=comment)))
+                if len(chunk) == COMMENTS_CHUNK_SIZE:
+                    yield ''.join(chunk)
+                    chunk = []
+        yield ''.join(chunk) + tail
+
+
+class EditPost(PrimaryStickyMixin, PostFormMixin, WhileUpdateDeleteMixin,
                LoginRequiredMixin, UpdateView):
     pk_url_kwarg = 'post_id'
 
 
-class LeaveComment(CommentFormMixin, LoginRequiredMixin, CreateView):
+class LeaveComment(PrimaryStickyMixin, CommentFormMixin, LoginRequiredMixin,
+                   RateLimitMixin, CreateView):
+    rate_limit_scope = 'comment'
     post_comment = None
 
     def dispatch(self, request, *args, **kwargs):
@@ -122,27 +191,41 @@ class LeaveComment(CommentFormMixin, LoginRequiredMixin, CreateView):
     def form_valid(self, form):
         form.instance.author = self.request.user
         form.instance.post = self.post_comment
-        return super().form_valid(form)
+        response = super().form_valid(form)
+        transaction.on_commit(lambda: publish_comment(self.object))
+        return response
 
     def get_success_url(self):
         return reverse_lazy('blog:post_detail',
                             kwargs={'post_id': self.kwargs['post_id']})
 
 
-class EditComment(CommentFormMixin, WhileUpdateDeleteMixin,
-                  LoginRequiredMixin, UpdateView):
+class CommentStream(View):
+    def get(self, request, *args, **kwargs):
+        return HttpResponse(
+            'Поток комментариев доступен только при запуске через ASGI.',
+            status=501, content_type='text/plain; charset=utf-8')
+
+
+class EditComment(PrimaryStickyMixin, CommentFormMixin,
+                  WhileUpdateDeleteMixin, LoginRequiredMixin, UpdateView):
     pk_url_kwarg = 'comment_id'
 
 
-class DeleteComment(CommentFormMixin, WhileUpdateDeleteMixin,
-                    LoginRequiredMixin, DeleteView):
+class DeleteComment(PrimaryStickyMixin, CommentFormMixin,
+                    WhileUpdateDeleteMixin, LoginRequiredMixin, DeleteView):
     pk_url_kwarg = 'comment_id'
 
 
-class CategoryPosts(PostModelMixin, PublishedPostsMixin, ListView):
+class CategoryPosts(ReadReplicaMixin, ConditionalGetMixin,
+                    StaleWhileRevalidateMixin, PostModelMixin,
+                    PublishedPostsMixin, ListView):
     template_name = 'blog/category.html'
     category = None
 
+    def get_freshness(self):
+        return get_feed_freshness()
+
     def get_queryset(self):
         self.category = get_object_or_404(
             Category,
@@ -159,7 +242,7 @@ class CategoryPosts(PostModelMixin, PublishedPostsMixin, ListView):
         return context
 
 
-class EditUserProfile(LoginRequiredMixin, UpdateView):
+class EditUserProfile(PrimaryStickyMixin, LoginRequiredMixin, UpdateView):
     model = User
     form_class = UserForm
     template_name = 'blog/user.html'
@@ -172,7 +255,8 @@ class EditUserProfile(LoginRequiredMixin, UpdateView):
                             kwargs={'username': self.request.user.username})
 
 
-class DeletePost(PostFormMixin, LoginRequiredMixin, DeleteView):
+class DeletePost(PrimaryStickyMixin, PostFormMixin, LoginRequiredMixin,
+                 DeleteView):
     pk_url_kwarg = 'post_id'
     success_url = reverse_lazy('blog:index')
 
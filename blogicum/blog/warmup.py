@@ -0,0 +1,74 @@
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.db.models import Count
+from django.urls import reverse
+
+from core import metrics
+
+from .constants import COMMENTS_STREAM_THRESHOLD, POSTS_LIMIT
+from .models import Post
+
+WARMUP_HEADER = 'X-Cache-Warmup'
+
+
+def is_warmup_request(request):
+    return 'HTTP_X_CACHE_WARMUP' in request.META
+
+
+def get_feed_urls(url, posts_count, pages):
+    pages = min(pages, math.ceil(posts_count / POSTS_LIMIT)) or 1
+    return [url] + [f'{url}?page={page}' for page in range(2, pages + 1)]
+
+
+def get_top_posts(limit):
+    return Post.filtered_objects.annotate(
+        comment_count=Count('comments')
+    ).filter(
+        comment_count__lt=COMMENTS_STREAM_THRESHOLD
+    ).order_by('-views_count', '-pub_date').values_list('pk', flat=True)[
+        :limit]
+
+
+def get_warmup_urls(pages, posts):
+    urls = get_feed_urls(
+        reverse('blog:index'), Post.filtered_objects.count(), pages)
+    categories = Post.filtered_objects.order_by().values(
+        'category__slug').annotate(posts_count=Count('id'))
+    for category in categories.order_by('category__slug'):
+        urls += get_feed_urls(
+            reverse('blog:category_posts',
+                    args=[category['category__slug']]),
+            category['posts_count'], pages)
+    return urls + [
+        reverse('blog:post_detail', args=[post_id])
+        for post_id in get_top_posts(posts)
+    ]
+
+
+def warm_url(base_url, url):
+    request = Request(base_url.rstrip('/') + url,
+                      headers={WARMUP_HEADER: '1'})
+    started = time.perf_counter()
+    try:
+        with urlopen(request, timeout=settings.CACHE_WARMUP_TIMEOUT) as (
+                response):
+            response.read()
+            status = response.status
+    except HTTPError as error:
+        status = error.code
+    except URLError as error:
+        status = error.reason
+    elapsed = time.perf_counter() - started
+    metrics.observe('warmup.render_ms', elapsed * 1000)
+    return url, status, elapsed
+
+
+def warm_cache(base_url, urls, workers):
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            lambda url: warm_url(base_url, url), urls))
@@ -4,4 +4,8 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blogicum.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from blog.live import LiveCommentsRouter  # noqa: E402
+
+application = LiveCommentsRouter(django_application)
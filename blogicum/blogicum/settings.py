@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 
@@ -21,6 +22,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'core.apps.CoreConfig',
     'pages.apps.PagesConfig',
     'blog.apps.BlogConfig',
     'django_bootstrap5',
@@ -29,10 +31,14 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.StaticFilesMiddleware',
+    'core.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.auth.CachedAuthenticationMiddleware',
+    'core.middleware.HashingBackpressureMiddleware',
+    'core.middleware.LoadSheddingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'debug_toolbar.middleware.DebugToolbarMiddleware'
@@ -40,6 +46,10 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'blogicum.urls'
 
+LIVE_COMMENTS_QUEUE_SIZE = 100
+
+LIVE_COMMENTS_HEARTBEAT = 15
+
 
 TEMPLATES_DIR = BASE_DIR / 'templates'
 
@@ -67,9 +77,109 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+REPLICA_DATABASE = None
+
+if os.environ.get('BLOGICUM_REPLICA_DB'):
+    DATABASES['replica'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ['BLOGICUM_REPLICA_DB'],
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
+        'TEST': {'MIRROR': 'default'},
+    }
+    REPLICA_DATABASE = 'replica'
+
+DATABASE_ROUTERS = ['core.routers.PrimaryReplicaRouter']
+
+REPLICA_STICKY_COOKIE = 'primary_sticky'
+
+REPLICA_STICKY_SECONDS = 10
+
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64 * 1024,
+    'temp_store': 'MEMORY',
+    'busy_timeout': 5000,
+}
+
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'blogicum',
+    },
+    'sessions': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'session_cache',
+    },
+}
+
+
+PASSWORD_HASHERS = [
+    'core.hashing.PooledPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
+PASSWORD_HASHING_WORKERS = 2
+
+PASSWORD_HASHING_QUEUE_SIZE = 8
+
+PASSWORD_HASHING_RETRY_AFTER = 5
+
+RATE_LIMITS = {
+    'comment': {'user': (10, 60), 'ip': (30, 60)},
+    'post': {'user': (5, 60), 'ip': (15, 60)},
+    'registration': {'ip': (5, 60 * 60)},
+}
+
+RATE_LIMIT_CACHE = 'default'
+
+LOAD_SHEDDING_LIMITS = {'read': 32, 'write': 8}
+
+LOAD_SHEDDING_STALE_TIMEOUT = 10 * 60
+
+LOAD_SHEDDING_STALE_REFRESH = 30
+
+LOAD_SHEDDING_RETRY_AFTER = 2
+
+PAGE_CACHE_FRESH_SECONDS = 60
+
+PAGE_CACHE_TIMEOUT = 24 * 60 * 60
+
+PAGE_CACHE_LOCK_TIMEOUT = 10
+
+PAGE_CACHE_COALESCE_TIMEOUT = 2
+
+CACHE_WARMUP_PAGES = 3
+
+CACHE_WARMUP_POSTS = 20
+
+CACHE_WARMUP_WORKERS = 4
+
+CACHE_WARMUP_URL = 'http://localhost:8000'
+
+CACHE_WARMUP_TIMEOUT = 30
+
+TRENDING_WINDOW_HOURS = 48
+
+TRENDING_GRAVITY = 1.5
+
+TRENDING_BATCH_SIZE = 500
+
+TRENDING_VIEW_WEIGHT = 0.05
+
+TRENDING_MIN_SCORE = 0.01
+
+VIEW_COUNTS_FLUSH_INTERVAL = 5
+
+VIEW_COUNTS_SPOOL = BASE_DIR / 'view_counts.spool'
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -104,6 +214,35 @@ STATICFILES_DIRS = [
     BASE_DIR / 'static_files'
 ]
 
+STATIC_ROOT = BASE_DIR / 'static'
+
+STATICFILES_STORAGE = 'core.storage.CompressedManifestStaticFilesStorage'
+
+STATIC_CACHE_SECONDS = 60 * 60
+
+COMPRESSION_MIN_SIZE = 1024
+
+COMPRESSION_LEVELS = {'br': 5, 'gzip': 6}
+
+CSS_SOURCE = BASE_DIR / 'static_files' / 'css' / 'bootstrap.min.css'
+
+CSS_PRUNED_OUTPUT = BASE_DIR / 'static_files' / 'css' / 'bootstrap.pruned.css'
+
+CSS_CRITICAL_OUTPUT = TEMPLATES_DIR / 'includes' / 'critical_css.html'
+
+CSS_CRITICAL_TEMPLATES = [
+    TEMPLATES_DIR / 'base.html',
+    TEMPLATES_DIR / 'includes' / 'header.html',
+]
+
+CSS_SAFELIST = [
+    'alert', 'alert-danger', 'alert-dismissible', 'btn', 'btn-close',
+    'btn-primary', 'fade', 'form-check', 'form-check-input',
+    'form-check-label', 'form-control', 'form-label', 'form-select',
+    'form-text', 'input-group', 'input-group-text', 'invalid-feedback',
+    'is-invalid', 'mb-3', 'show', 'visually-hidden',
+]
+
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -118,10 +257,30 @@ LOGIN_REDIRECT_URL = 'blog:index'
 
 LOGIN_URL = 'login'
 
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+SESSION_CACHE_ALIAS = 'sessions'
+
+USER_CACHE_TIMEOUT = 5 * 60
+
+MEDIA_URL = '/media/'
+
 MEDIA_ROOT = BASE_DIR / 'media'
 
+MEDIA_CACHE_SECONDS = 24 * 60 * 60
+
 POST_IMAGES_UPLOAD_FOLDER = 'post_images'
 
-EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
+EMAIL_BACKEND = 'core.mail.OutboxBackend'
+
+OUTBOX_DELIVERY_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
 
 EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
+
+OUTBOX_BATCH_SIZE = 50
+
+OUTBOX_MAX_ATTEMPTS = 5
+
+OUTBOX_RETRY_DELAY = 60
+
+OUTBOX_CLAIM_TIMEOUT = 10 * 60
@@ -0,0 +1,26 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from .models import OutboxMessage
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = (
+        'subject',
+        'recipients',
+        'status',
+        'attempts',
+        'next_attempt_at',
+        'created_at',
+    )
+    list_filter = ('status',)
+    readonly_fields = ('message', 'last_error', 'sent_at')
+    list_per_page = 20
+    actions = ('retry',)
+
+    @admin.action(description='Повторить отправку')
+    def retry(self, request, queryset):
+        queryset.exclude(status=OutboxMessage.SENT).update(
+            status=OutboxMessage.PENDING, attempts=0,
+            next_attempt_at=timezone.now())
@@ -1,6 +1,25 @@
 from django.apps import AppConfig
+from django.contrib.auth.signals import user_logged_out
+from django.conf import settings
+from django.core.signals import request_started
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from .auth import invalidate_cached_user, invalidate_logged_out_user
+        from .db import (apply_sqlite_pragmas, check_reused_connections,
+                         count_opened_connection)
+
+        connection_created.connect(apply_sqlite_pragmas)
+        connection_created.connect(count_opened_connection)
+        request_started.connect(check_reused_connections)
+        post_save.connect(invalidate_cached_user,
+                          sender=settings.AUTH_USER_MODEL)
+        post_delete.connect(invalidate_cached_user,
+                            sender=settings.AUTH_USER_MODEL)
+        user_logged_out.connect(invalidate_logged_out_user)
@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.contrib import auth
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.core.cache import caches
+from django.utils.crypto import constant_time_compare
+from django.utils.functional import SimpleLazyObject
+
+from . import metrics
+
+
+def get_user_cache():
+    return caches[settings.SESSION_CACHE_ALIAS]
+
+
+def get_user_cache_key(user_id):
+    return f'auth:user:{user_id}'
+
+
+def get_cached_user(request):
+    if not hasattr(request, '_cached_user'):
+        request._cached_user = load_user(request)
+    return request._cached_user
+
+
+def load_user(request):
+    user_id = request.session.get(auth.SESSION_KEY)
+    session_hash = request.session.get(auth.HASH_SESSION_KEY)
+    if user_id is not None and session_hash:
+        user = get_user_cache().get(get_user_cache_key(user_id))
+        if user is not None and user.is_active and constant_time_compare(
+                session_hash, user.get_session_auth_hash()):
+            metrics.incr('auth.user_cache.hits')
+            return user
+    metrics.incr('auth.user_cache.misses')
+    user = auth.get_user(request)
+    if user.is_authenticated:
+        get_user_cache().set(get_user_cache_key(user.pk), user,
+                             settings.USER_CACHE_TIMEOUT)
+    return user
+
+
+def invalidate_cached_user(sender, instance, **kwargs):
+    get_user_cache().delete(get_user_cache_key(instance.pk))
+
+
+def invalidate_logged_out_user(sender, user, **kwargs):
+    if user is not None:
+        get_user_cache().delete(get_user_cache_key(user.pk))
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    def process_request(self, request):
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: get_cached_user(request))
@@ -0,0 +1,94 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import Client
+from django.test.utils import (setup_test_environment,
+                               teardown_test_environment)
+from django.utils import timezone
+
+from blog.models import Category, Location, Post
+
+User = get_user_model()
+
+
+@contextmanager
+def benchmark_database(alias=DEFAULT_DB_ALIAS):
+    connection = connections[alias]
+    tmp_dir = tempfile.mkdtemp(prefix='blogicum-bench-')
+    connection.settings_dict['TEST']['NAME'] = os.path.join(
+        tmp_dir, 'bench.sqlite3')
+    setup_test_environment(debug=False)
+    old_name = connection.creation.create_test_db(
+        verbosity=0, autoclobber=True, serialize=False)
+    try:
+        yield connection
+    finally:
+        connections.close_all()
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def seed_posts(count, authors=1):
+    users = [
+        User.objects.create(username=f'bench-author-{i}')
+        for i in range(authors)
+    ]
+    category = Category.objects.create(
+        title='Нагрузка', description='Бенчмарк', slug='bench')
+    location = Location.objects.create(name='Стенд')
+    Post.objects.bulk_create(
+        Post(
+            title=f'Публикация {i}',
+            text='Текст публикации. ' * 20,
+            pub_date=timezone.now(),
+            author=users[i % authors],
+            category=category,
+            location=location,
+        )
+        for i in range(count)
+    )
+    return users
+
+
+def make_client(user=None):
+    client = Client(HTTP_HOST=settings.ALLOWED_HOSTS[0])
+    if user is not None:
+        client.force_login(user)
+    return client
+
+
+def run_workers(workers, duration):
+    results = [None] * len(workers)
+    deadline = time.perf_counter() + duration
+
+    def loop(index, work):
+        ok = failed = 0
+        try:
+            while time.perf_counter() < deadline:
+                try:
+                    work()
+                except Exception:
+                    failed += 1
+                else:
+                    ok += 1
+        finally:
+            connections.close_all()
+        results[index] = (ok, failed)
+
+    threads = [
+        threading.Thread(target=loop, args=(index, work))
+        for index, work in enumerate(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
@@ -0,0 +1,113 @@
+import gzip
+import io
+import secrets
+import string
+import time
+import zlib
+
+from . import metrics
+from .storage import brotli
+
+COMPRESSIBLE_CONTENT_TYPES = (
+    'text/', 'application/json', 'application/javascript',
+    'application/xml', 'application/rss+xml', 'application/atom+xml',
+    'image/svg+xml',
+)
+
+PADDING_MAX_LENGTH = 100
+
+
+def parse_accept_encoding(header):
+    encodings = {}
+    for part in header.split(','):
+        encoding, *params = (item.strip() for item in part.split(';'))
+        quality = 1.0
+        for param in params:
+            if param.startswith('q='):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if encoding:
+            encodings[encoding.lower()] = quality
+    return {encoding for encoding, quality in encodings.items() if quality}
+
+
+def random_filename():
+    return ''.join(
+        secrets.choice(string.ascii_letters)
+        for _ in range(secrets.randbelow(PADDING_MAX_LENGTH) + 1)
+    )
+
+
+class GzipCompressor:
+    def __init__(self, level, padding=False):
+        self.buffer = io.BytesIO()
+        self.file = gzip.GzipFile(
+            filename=random_filename() if padding else '', mode='wb',
+            fileobj=self.buffer, compresslevel=level, mtime=0)
+
+    def drain(self):
+        data = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        return data
+
+    def process(self, data):
+        self.file.write(data)
+        return self.drain()
+
+    def flush(self):
+        self.file.flush(zlib.Z_SYNC_FLUSH)
+        return self.drain()
+
+    def finish(self):
+        self.file.close()
+        return self.drain()
+
+
+def get_compressor(encoding, level, padding=False):
+    if encoding == 'br':
+        return brotli.Compressor(quality=level)
+    return GzipCompressor(level, padding=padding)
+
+
+def available_encodings():
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+class MeasuredCompressor:
+    def __init__(self, encoding, level, padding=False):
+        self.encoding = encoding
+        self.level = level
+        self.compressor = get_compressor(encoding, level, padding=padding)
+        self.cpu_time = 0.0
+        self.bytes_in = self.bytes_out = 0
+
+    def call(self, method, *args):
+        started = time.thread_time()
+        data = getattr(self.compressor, method)(*args)
+        self.cpu_time += time.thread_time() - started
+        self.bytes_out += len(data)
+        return data
+
+    def compress(self, data):
+        self.bytes_in += len(data)
+        return self.call('process', data) + self.call('flush')
+
+    def finish(self):
+        data = self.call('finish')
+        self.record()
+        return data
+
+    def record(self):
+        prefix = f'compression.{self.encoding}'
+        metrics.incr(f'{prefix}.responses')
+        metrics.incr(f'{prefix}.bytes_in', self.bytes_in)
+        metrics.incr(f'{prefix}.bytes_out', self.bytes_out)
+        metrics.observe(f'{prefix}.level_{self.level}.cpu_ms',
+                        self.cpu_time * 1000)
+
+    def server_timing(self):
+        return (f'compress;dur={self.cpu_time * 1000:.3f};'
+                f'desc="{self.encoding}-{self.level}"')
@@ -0,0 +1,150 @@
+import re
+from pathlib import Path
+
+CLASS_ATTR_RE = re.compile(r'class="([^"]*)"|class=\'([^\']*)\'')
+TAG_RE = re.compile(r'<([a-zA-Z][a-zA-Z0-9]*)')
+TEMPLATE_SYNTAX_RE = re.compile(r'{%.*?%}|{{.*?}}|{#.*?#}', re.S)
+COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+BANNER_RE = re.compile(r'/\*!.*?\*/', re.S)
+NOT_RE = re.compile(r':not\([^)]*\)')
+ATTRIBUTE_RE = re.compile(r'\[[^\]]*\]')
+PSEUDO_RE = re.compile(r'::?[\w-]+(\([^)]*\))?')
+CLASS_RE = re.compile(r'\.(-?[_a-zA-Z][\w-]*)')
+ID_RE = re.compile(r'#[\w-]+')
+TYPE_RE = re.compile(r'(?:^|[\s>+~])([a-z][a-z0-9]*)')
+KEYFRAMES_RE = re.compile(r'@(?:-webkit-)?keyframes\s+([\w-]+)')
+NESTED_AT_RULES = ('@media', '@supports')
+ALWAYS_USED_TAGS = {'html', 'body'}
+
+
+class Usage:
+    def __init__(self, classes, tags=None):
+        self.classes = set(classes)
+        self.tags = None if tags is None else set(tags) | ALWAYS_USED_TAGS
+
+    def matches(self, selector):
+        selector = NOT_RE.sub('', selector)
+        selector = ATTRIBUTE_RE.sub('', PSEUDO_RE.sub('', selector))
+        if not set(CLASS_RE.findall(selector)) <= self.classes:
+            return False
+        if self.tags is None:
+            return True
+        selector = ID_RE.sub('', CLASS_RE.sub('', selector))
+        return set(TYPE_RE.findall(selector)) <= self.tags
+
+
+def scan_templates(paths):
+    classes, tags = set(), set()
+    for path in paths:
+        source = TEMPLATE_SYNTAX_RE.sub(
+            ' ', Path(path).read_text(encoding='utf-8'))
+        tags.update(tag.lower() for tag in TAG_RE.findall(source))
+        for double_quoted, single_quoted in CLASS_ATTR_RE.findall(source):
+            classes.update((double_quoted or single_quoted).split())
+    return classes, tags
+
+
+def find_templates(directories):
+    for directory in directories:
+        yield from sorted(Path(directory).rglob('*.html'))
+
+
+def find_block_end(css, start):
+    depth, quote, index = 0, None, start
+    while index < len(css):
+        char = css[index]
+        if quote:
+            if char == '\\':
+                index += 1
+            elif char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return index
+        index += 1
+    raise ValueError('Незакрытый блок в CSS.')
+
+
+def parse_css(css):
+    rules, index = [], 0
+    while True:
+        brace, semicolon = css.find('{', index), css.find(';', index)
+        if brace == -1:
+            break
+        if semicolon != -1 and semicolon < brace:
+            rules.append((css[index:semicolon + 1].strip(), None))
+            index = semicolon + 1
+            continue
+        end = find_block_end(css, brace)
+        prelude, body = css[index:brace].strip(), css[brace + 1:end]
+        if prelude.startswith(NESTED_AT_RULES):
+            body = parse_css(body)
+        rules.append((prelude, body))
+        index = end + 1
+    return rules
+
+
+def split_selectors(prelude):
+    selectors, depth, current = [], 0, ''
+    for char in prelude:
+        depth += {'(': 1, ')': -1}.get(char, 0)
+        if char == ',' and depth == 0:
+            selectors.append(current)
+            current = ''
+        else:
+            current += char
+    return selectors + [current]
+
+
+def prune_rules(rules, usage):
+    kept = []
+    for prelude, body in rules:
+        if body is None or prelude.startswith('@'):
+            if isinstance(body, list):
+                body = prune_rules(body, usage)
+                if not body:
+                    continue
+            kept.append((prelude, body))
+            continue
+        selectors = [
+            selector for selector in split_selectors(prelude)
+            if usage.matches(selector)
+        ]
+        if selectors:
+            kept.append((','.join(selectors), body))
+    return kept
+
+
+def serialize(rules):
+    return ''.join(
+        prelude if body is None else '{}{{{}}}'.format(
+            prelude, serialize(body) if isinstance(body, list) else body)
+        for prelude, body in rules
+    )
+
+
+def drop_unused_keyframes(rules):
+    css = serialize(
+        rule for rule in rules if not KEYFRAMES_RE.match(rule[0]))
+    return [
+        (prelude, body) for prelude, body in rules
+        if not KEYFRAMES_RE.match(prelude)
+        or KEYFRAMES_RE.match(prelude).group(1) in css
+    ]
+
+
+def prune_css(css, usage, standalone=True):
+    rules = drop_unused_keyframes(
+        prune_rules(parse_css(COMMENT_RE.sub('', css)), usage))
+    charset = bool(rules) and rules[0][0].startswith('@charset')
+    banner = BANNER_RE.search(css)
+    if not standalone:
+        rules = rules[charset:]
+    elif banner:
+        rules.insert(int(charset), (banner.group(0), None))
+    return serialize(rules)
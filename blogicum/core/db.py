@@ -0,0 +1,33 @@
+import re
+
+from django.conf import settings
+from django.db import connections
+
+from . import metrics
+
+PRAGMA_NAME_RE = re.compile(r'^[a-z_]+$')
+
+
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    for name, value in getattr(settings, 'SQLITE_PRAGMAS', {}).items():
+        if not PRAGMA_NAME_RE.match(name):
+            raise ValueError(f'Недопустимое имя PRAGMA: {name!r}')
+        connection.connection.execute(f'PRAGMA {name} = {value}')
+
+
+def count_opened_connection(sender, connection, **kwargs):
+    metrics.incr('db.connections.opened')
+
+
+def check_reused_connections(**kwargs):
+    for connection in connections.all():
+        if connection.connection is None:
+            continue
+        if (connection.settings_dict.get('CONN_HEALTH_CHECKS')
+                and not connection.is_usable()):
+            connection.close()
+            metrics.incr('db.connections.failed')
+            continue
+        metrics.incr('db.connections.reused')
@@ -0,0 +1,59 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+from . import metrics
+
+
+class HashingOverloaded(Exception):
+    pass
+
+
+class HashingPool:
+    def __init__(self, workers, queue_size):
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='password-hashing')
+        self.slots = threading.BoundedSemaphore(workers + queue_size)
+
+    def run(self, func, *args):
+        if not self.slots.acquire(blocking=False):
+            metrics.incr('auth.hashing.rejected')
+            raise HashingOverloaded
+        try:
+            submitted = time.perf_counter()
+            return self.executor.submit(
+                self.measure, func, submitted, *args).result()
+        finally:
+            self.slots.release()
+
+    @staticmethod
+    def measure(func, submitted, *args):
+        started = time.perf_counter()
+        metrics.observe('auth.hashing.queue_wait_ms',
+                        (started - submitted) * 1000)
+        try:
+            return func(*args)
+        finally:
+            metrics.observe('auth.hashing.latency_ms',
+                            (time.perf_counter() - started) * 1000)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = HashingPool(settings.PASSWORD_HASHING_WORKERS,
+                                settings.PASSWORD_HASHING_QUEUE_SIZE)
+        return _pool
+
+
+class PooledPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    def encode(self, password, salt, iterations=None):
+        return get_pool().run(super().encode, password, salt, iterations)
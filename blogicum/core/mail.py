@@ -0,0 +1,121 @@
+import time
+from datetime import timedelta
+from email import message_from_bytes
+from email.message import Message
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.mail.message import MIMEMixin
+from django.utils import timezone
+
+from . import metrics
+from .models import OutboxMessage
+
+
+class QueuedMIMEMessage(MIMEMixin, Message):
+    pass
+
+
+class QueuedEmailMessage(EmailMessage):
+    def __init__(self, outbox_message):
+        super().__init__(
+            subject=outbox_message.subject,
+            from_email=outbox_message.from_email,
+            to=outbox_message.recipients.split('\n'),
+        )
+        self.raw_message = bytes(outbox_message.message)
+
+    def message(self):
+        return message_from_bytes(self.raw_message, _class=QueuedMIMEMessage)
+
+
+class OutboxBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        queued = OutboxMessage.objects.bulk_create(
+            OutboxMessage(
+                from_email=message.from_email,
+                recipients='\n'.join(message.recipients()),
+                subject=message.subject[:255],
+                message=message.message().as_bytes(linesep='\r\n'),
+            )
+            for message in email_messages
+            if message.recipients()
+        )
+        metrics.incr('outbox.queued', len(queued))
+        return len(queued)
+
+
+def get_retry_delay(attempts):
+    return timedelta(seconds=settings.OUTBOX_RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def claim_batch(batch_size):
+    now = timezone.now()
+    lease_until = now + timedelta(seconds=settings.OUTBOX_CLAIM_TIMEOUT)
+    due = OutboxMessage.objects.filter(
+        status__in=(OutboxMessage.PENDING, OutboxMessage.SENDING),
+        next_attempt_at__lte=now,
+    )[:batch_size]
+    batch = []
+    for outbox_message in due:
+        claimed = OutboxMessage.objects.filter(
+            pk=outbox_message.pk,
+            status=outbox_message.status,
+            next_attempt_at=outbox_message.next_attempt_at,
+        ).update(status=OutboxMessage.SENDING, next_attempt_at=lease_until)
+        if claimed:
+            outbox_message.status = OutboxMessage.SENDING
+            outbox_message.next_attempt_at = lease_until
+            batch.append(outbox_message)
+    return batch
+
+
+def deliver_batch(batch_size):
+    batch = claim_batch(batch_size)
+    if not batch:
+        return {}
+    started = time.perf_counter()
+    results = {'sent': 0, 'failed': 0, 'dead': 0}
+    connection = get_connection(settings.OUTBOX_DELIVERY_BACKEND)
+    try:
+        connection.open()
+    except Exception as error:
+        for outbox_message in batch:
+            results[record_failure(outbox_message, error)] += 1
+    else:
+        try:
+            for outbox_message in batch:
+                results[deliver(connection, outbox_message)] += 1
+        finally:
+            connection.close()
+    for name, value in results.items():
+        metrics.incr(f'outbox.{name}', value)
+    metrics.observe('outbox.batch_ms', (time.perf_counter() - started) * 1000)
+    return results
+
+
+def deliver(connection, outbox_message):
+    try:
+        connection.send_messages([QueuedEmailMessage(outbox_message)])
+    except Exception as error:
+        return record_failure(outbox_message, error)
+    outbox_message.status = OutboxMessage.SENT
+    outbox_message.attempts += 1
+    outbox_message.sent_at = timezone.now()
+    outbox_message.save(update_fields=('status', 'attempts', 'sent_at'))
+    return 'sent'
+
+
+def record_failure(outbox_message, error):
+    outbox_message.attempts += 1
+    outbox_message.last_error = f'{type(error).__name__}: {error}'
+    if outbox_message.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+        outbox_message.status = OutboxMessage.DEAD
+    else:
+        outbox_message.status = OutboxMessage.PENDING
+        outbox_message.next_attempt_at = (
+            timezone.now() + get_retry_delay(outbox_message.attempts))
+    outbox_message.save(update_fields=(
+        'attempts', 'last_error', 'status', 'next_attempt_at'))
+    return 'dead' if outbox_message.status == OutboxMessage.DEAD else 'failed'
@@ -0,0 +1,89 @@
+import asyncio
+import itertools
+import time
+
+from asgiref.sync import sync_to_async
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test import AsyncClient
+from django.urls import reverse
+
+from blog.models import Post
+from core.benchmarks import benchmark_database, make_client, seed_posts
+
+
+class Command(BaseCommand):
+    help = ('Сравнивает число запросов в секунду к страницам чтения '
+            'на одном воркере под WSGI и под ASGI. В Django 3.2 нет '
+            'асинхронного ORM, поэтому под ASGI представления выполняются '
+            'в потоке через sync_to_async.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--duration', type=float, default=5.0)
+        parser.add_argument('--concurrency', type=int, default=8)
+        parser.add_argument('--posts', type=int, default=200)
+
+    def handle(self, *args, **options):
+        with benchmark_database():
+            seed_posts(options['posts'])
+            urls = self.get_urls()
+            profiles = (
+                ('wsgi', self.measure_wsgi),
+                ('asgi', self.measure_asgi),
+            )
+            for label, measure in profiles:
+                ok, failed = measure(urls, options)
+                self.stdout.write(
+                    f'{label:>10}: {ok / options["duration"]:8.1f} '
+                    f'req/s (ошибок {failed})')
+
+    @staticmethod
+    def get_urls():
+        post = Post.objects.first()
+        return (
+            reverse('blog:index'),
+            reverse('blog:post_detail', args=(post.id,)),
+            reverse('blog:category_posts', args=(post.category.slug,)),
+            reverse('blog:profile', args=(post.author.username,)),
+            reverse('pages:about'),
+        )
+
+    @staticmethod
+    def measure_wsgi(urls, options):
+        client = make_client()
+        ok = failed = 0
+        deadline = time.perf_counter() + options['duration']
+        for url in itertools.cycle(urls):
+            if time.perf_counter() >= deadline:
+                break
+            if client.get(url).status_code == 200:
+                ok += 1
+            else:
+                failed += 1
+        return ok, failed
+
+    def measure_asgi(self, urls, options):
+        return asyncio.run(self.run_asgi(urls, options))
+
+    @staticmethod
+    async def run_asgi(urls, options):
+        deadline = time.perf_counter() + options['duration']
+
+        async def worker(offset):
+            client = AsyncClient()
+            ok = failed = 0
+            for url in itertools.islice(itertools.cycle(urls), offset, None):
+                if time.perf_counter() >= deadline:
+                    break
+                response = await client.get(url)
+                if response.status_code == 200:
+                    ok += 1
+                else:
+                    failed += 1
+            return ok, failed
+
+        results = await asyncio.gather(
+            *(worker(index) for index in range(options['concurrency'])))
+        await sync_to_async(connections.close_all)()
+        return (sum(ok for ok, _ in results),
+                sum(failed for _, failed in results))
@@ -0,0 +1,47 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.signals import request_finished, request_started
+from django.db import connection
+
+from blog.models import Post
+from core import metrics
+from core.benchmarks import benchmark_database, seed_posts
+
+
+class Command(BaseCommand):
+    help = ('Измеряет накладные расходы на открытие соединения с БД '
+            'в расчёте на запрос: без повторного использования '
+            'соединений и с CONN_MAX_AGE.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=2000)
+        parser.add_argument('--max-age', type=int, default=60)
+
+    def handle(self, *args, **options):
+        with benchmark_database():
+            seed_posts(10)
+            results = {}
+            for label, max_age in (('per-request', 0),
+                                   ('persistent', options['max_age'])):
+                connection.close()
+                connection.settings_dict['CONN_MAX_AGE'] = max_age
+                metrics.reset()
+                results[label] = self.measure(options['requests'])
+                counters = metrics.snapshot()['counters']
+                self.stdout.write(
+                    f'{label:>11}: {results[label] * 1000:7.3f} ms/запрос, '
+                    f'открыто {counters.get("db.connections.opened", 0)}, '
+                    f'повторно {counters.get("db.connections.reused", 0)}'
+                )
+            overhead = results['per-request'] - results['persistent']
+            self.stdout.write(
+                f'Открытие соединения: {overhead * 1000:.3f} ms/запрос')
+
+    def measure(self, requests):
+        started = time.perf_counter()
+        for _ in range(requests):
+            request_started.send(sender=self.__class__, environ={})
+            Post.objects.exists()
+            request_finished.send(sender=self.__class__)
+        return (time.perf_counter() - started) / requests
@@ -0,0 +1,75 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test import override_settings
+from django.urls import reverse
+
+from blog.models import Post
+from core.benchmarks import (benchmark_database, make_client, run_workers,
+                             seed_posts)
+
+BASELINE_PRAGMAS = {'journal_mode': 'DELETE', 'synchronous': 'FULL'}
+
+
+class Command(BaseCommand):
+    help = ('Сравнивает пропускную способность чтения ленты при '
+            'параллельной записи комментариев без настроек SQLite '
+            'и с SQLITE_PRAGMAS.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--duration', type=float, default=5.0)
+        parser.add_argument('--readers', type=int, default=4)
+        parser.add_argument('--writers', type=int, default=2)
+        parser.add_argument('--posts', type=int, default=200)
+
+    def handle(self, *args, **options):
+        with benchmark_database():
+            users = seed_posts(options['posts'], authors=options['writers'])
+            post = Post.objects.first()
+            profiles = (
+                ('baseline', BASELINE_PRAGMAS),
+                ('tuned', settings.SQLITE_PRAGMAS),
+            )
+            for label, pragmas in profiles:
+                connections.close_all()
+                with override_settings(SQLITE_PRAGMAS=pragmas):
+                    reads, writes = self.measure(post, users, options)
+                self.report(label, reads, writes, options['duration'])
+
+    def measure(self, post, users, options):
+        comment_url = reverse('blog:add_comment', args=(post.id,))
+        readers = []
+        for _ in range(options['readers']):
+            client = make_client()
+            readers.append(lambda client=client: self.read(client))
+        writers = []
+        for index in range(options['writers']):
+            client = make_client(users[index])
+            writers.append(
+                lambda client=client: self.write(client, comment_url))
+        results = run_workers(readers + writers, options['duration'])
+        return results[:len(readers)], results[len(readers):]
+
+    @staticmethod
+    def read(client):
+        response = client.get(reverse('blog:index'))
+        if response.status_code != 200:
+            raise RuntimeError(response.status_code)
+
+    @staticmethod
+    def write(client, url):
+        response = client.post(url, {'text': 'Комментарий под нагрузкой'})
+        if response.status_code != 302:
+            raise RuntimeError(response.status_code)
+
+    def report(self, label, reads, writes, duration):
+        read_ok = sum(ok for ok, _ in reads)
+        read_failed = sum(failed for _, failed in reads)
+        write_ok = sum(ok for ok, _ in writes)
+        write_failed = sum(failed for _, failed in writes)
+        self.stdout.write(
+            f'{label:>8}: чтение {read_ok / duration:8.1f} req/s '
+            f'(ошибок {read_failed}), '
+            f'запись {write_ok / duration:8.1f} req/s '
+            f'(ошибок {write_failed})'
+        )
@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.css import Usage, find_templates, prune_css, scan_templates
+
+CRITICAL_TEMPLATE = '<style>{{% verbatim %}}{}{{% endverbatim %}}</style>\n'
+
+
+class Command(BaseCommand):
+    help = ('Собирает урезанную таблицу стилей Bootstrap по классам '
+            'из шаблонов и встраиваемый блок критического CSS.')
+
+    def handle(self, *args, **options):
+        source = settings.CSS_SOURCE.read_text(encoding='utf-8')
+        classes, _ = scan_templates(find_templates(
+            settings.TEMPLATES[0]['DIRS']))
+        pruned = prune_css(
+            source, Usage(classes | set(settings.CSS_SAFELIST)))
+        settings.CSS_PRUNED_OUTPUT.write_text(pruned, encoding='utf-8')
+
+        critical_classes, critical_tags = scan_templates(
+            settings.CSS_CRITICAL_TEMPLATES)
+        critical = prune_css(
+            source, Usage(critical_classes, critical_tags), standalone=False)
+        settings.CSS_CRITICAL_OUTPUT.write_text(
+            CRITICAL_TEMPLATE.format(critical), encoding='utf-8')
+
+        for label, css in (('исходный', source), ('урезанный', pruned),
+                           ('критический', critical)):
+            self.stdout.write(
+                f'{label:>11}: {len(css.encode()) / 1024:7.1f} КБ')
@@ -0,0 +1,38 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.mail import deliver_batch
+
+
+class Command(BaseCommand):
+    help = ('Отправляет письма из очереди пачками через одно '
+            'соединение, с повторами и пометкой недоставленных.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int,
+                            default=settings.OUTBOX_BATCH_SIZE)
+        parser.add_argument(
+            '--loop', action='store_true',
+            help='Работать непрерывно, проверяя очередь каждые --interval '
+                 'секунд.')
+        parser.add_argument('--interval', type=float, default=5.0)
+
+    def handle(self, *args, **options):
+        while True:
+            results = deliver_batch(options['batch_size'])
+            while results.get('sent'):
+                self.report(results)
+                results = deliver_batch(options['batch_size'])
+            if results:
+                self.report(results)
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+    def report(self, results):
+        self.stdout.write(
+            f'отправлено {results["sent"]}, '
+            f'отложено {results["failed"]}, '
+            f'не доставлено {results["dead"]}')
@@ -0,0 +1,37 @@
+import threading
+from collections import defaultdict
+
+_lock = threading.Lock()
+_counters = defaultdict(int)
+_timings = {}
+
+
+def incr(name, value=1):
+    with _lock:
+        _counters[name] += value
+
+
+def observe(name, value):
+    with _lock:
+        timing = _timings.setdefault(
+            name, {'count': 0, 'total': 0.0, 'max': 0.0})
+        timing['count'] += 1
+        timing['total'] += value
+        timing['max'] = max(timing['max'], value)
+
+
+def snapshot():
+    with _lock:
+        return {
+            'counters': dict(_counters),
+            'timings': {
+                name: dict(timing, avg=timing['total'] / timing['count'])
+                for name, timing in _timings.items()
+            },
+        }
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _timings.clear()
@@ -0,0 +1,193 @@
+import math
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+from . import metrics
+from .compression import (COMPRESSIBLE_CONTENT_TYPES, MeasuredCompressor,
+                          available_encodings, parse_accept_encoding)
+from .hashing import HashingOverloaded
+from .pagecache import build_response, get_page, is_cacheable, store_page
+from .ratelimit import too_many_requests
+from .static import build_static_index, find_media, serve_file
+
+
+class StaticFilesMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.index = build_static_index()
+
+    def __call__(self, request):
+        if request.method in ('GET', 'HEAD'):
+            entry = self.index.get(request.path_info) or find_media(
+                request.path_info)
+            if entry is not None:
+                return serve_file(request, entry)
+        return self.get_response(request)
+
+
+class CompressionMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not self.is_compressible(response):
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        padding = bool(request.META.get('CSRF_COOKIE_USED'))
+        encoding = self.select_encoding(
+            request, ('gzip',) if padding else available_encodings())
+        if encoding is None:
+            return response
+        compressor = MeasuredCompressor(
+            encoding, settings.COMPRESSION_LEVELS[encoding], padding=padding)
+        if response.streaming:
+            response.streaming_content = self.compress_stream(
+                response.streaming_content, compressor)
+            del response['Content-Length']
+        else:
+            content = compressor.compress(response.content)
+            content += compressor.finish()
+            if len(content) >= len(response.content):
+                return response
+            response.content = content
+            response['Content-Length'] = str(len(content))
+            response['Server-Timing'] = compressor.server_timing()
+        response['Content-Encoding'] = encoding
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
+
+    @staticmethod
+    def is_compressible(response):
+        if response.status_code != 200 or response.has_header(
+                'Content-Encoding'):
+            return False
+        if 'no-transform' in response.get('Cache-Control', ''):
+            return False
+        content_type = response.get('Content-Type', '').lower()
+        if not content_type.startswith(COMPRESSIBLE_CONTENT_TYPES):
+            return False
+        return response.streaming or (
+            len(response.content) >= settings.COMPRESSION_MIN_SIZE)
+
+    @staticmethod
+    def select_encoding(request, encodings):
+        accepted = parse_accept_encoding(
+            request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        for encoding in encodings:
+            if encoding in accepted:
+                return encoding
+        return None
+
+    @staticmethod
+    def compress_stream(content, compressor):
+        for chunk in content:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.finish()
+
+
+class HashingBackpressureMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_exception(self, request, exception):
+        if not isinstance(exception, HashingOverloaded):
+            return None
+        return too_many_requests(
+            'Слишком много запросов на вход и регистрацию, '
+            'попробуйте позже.', settings.PASSWORD_HASHING_RETRY_AFTER)
+
+
+class LoadSheddingMiddleware:
+    READ_METHODS = ('GET', 'HEAD', 'OPTIONS')
+    MAX_TRACKED_PAGES = 10000
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.lock = threading.Lock()
+        self.in_flight = defaultdict(int)
+        self.stored = {}
+
+    def __call__(self, request):
+        try:
+            response = self.get_response(request)
+        except BaseException:
+            self.release(request)
+            raise
+        if response.streaming:
+            response.streaming_content = self.release_after(
+                request, response.streaming_content)
+            return response
+        self.release(request)
+        if hasattr(request, '_load_shedding_key') and is_cacheable(
+                request, response) and not getattr(
+                    response, 'page_cached', False):
+            self.store_stale_page(request.get_full_path(), response)
+        return response
+
+    def release(self, request):
+        key = getattr(request, '_load_shedding_key', None)
+        if key is not None:
+            with self.lock:
+                self.in_flight[key] -= 1
+
+    def release_after(self, request, content):
+        try:
+            yield from content
+        finally:
+            self.release(request)
+
+    def store_stale_page(self, path, response):
+        now = time.monotonic()
+        if now - self.stored.get(path, -math.inf) < (
+                settings.LOAD_SHEDDING_STALE_REFRESH):
+            return
+        if len(self.stored) >= self.MAX_TRACKED_PAGES:
+            self.stored.clear()
+        self.stored[path] = now
+        store_page(path, response, settings.LOAD_SHEDDING_STALE_TIMEOUT)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view = getattr(view_func, 'view_class', view_func)
+        if not hasattr(view, '__qualname__'):
+            view = type(view)
+        kind = 'read' if request.method in self.READ_METHODS else 'write'
+        key = (f'{view.__module__}.{view.__qualname__}', kind)
+        with self.lock:
+            in_flight = self.in_flight[key]
+            admitted = in_flight < settings.LOAD_SHEDDING_LIMITS[kind]
+            if admitted:
+                self.in_flight[key] += 1
+        if admitted:
+            request._load_shedding_key = key
+            metrics.observe(f'load_shedding.{kind}.in_flight', in_flight + 1)
+            return None
+        return self.shed(request, kind)
+
+    @staticmethod
+    def shed(request, kind):
+        page = None
+        if kind == 'read' and not request.user.is_authenticated:
+            page = get_page(request.get_full_path())
+        if page is not None:
+            metrics.incr(f'load_shedding.{kind}.stale')
+            response = build_response(page)
+            response['Warning'] = '110 - "Response is Stale"'
+            return response
+        metrics.incr(f'load_shedding.{kind}.rejected')
+        response = HttpResponse(
+            'Сервер перегружен, попробуйте позже.', status=503)
+        response['Retry-After'] = settings.LOAD_SHEDDING_RETRY_AFTER
+        return response
@@ -0,0 +1,120 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.http import condition
+
+from . import metrics, pagecache
+from .routers import replica_for
+
+
+class ReadReplicaMixin:
+    def dispatch(self, request, *args, **kwargs):
+        with replica_for(request):
+            response = super().dispatch(request, *args, **kwargs)
+            self.resolve_response(response)
+        return response
+
+    def resolve_response(self, response):
+        if hasattr(response, 'render') and not response.is_rendered:
+            response.render()
+
+
+class PrimaryStickyMixin:
+    def dispatch(self, request, *args, **kwargs):
+        response = super().dispatch(request, *args, **kwargs)
+        if request.method == 'POST' and response.status_code == 302:
+            response.set_cookie(
+                settings.REPLICA_STICKY_COOKIE,
+                '1',
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
+
+
+class ConditionalGetMixin:
+    def get_freshness(self):
+        raise ImproperlyConfigured(
+            f'{type(self).__name__}: определите get_freshness().')
+
+    def get_validators(self):
+        freshness = self.get_freshness()
+        if freshness is None:
+            return None, None
+        fingerprint, last_modified = freshness
+        user = self.request.user
+        if user.is_authenticated:
+            csrf_cookie = self.request.META.get('CSRF_COOKIE', '')
+            fingerprint = (
+                f'{fingerprint}:{user.pk}:{user.username}:{csrf_cookie}')
+            last_modified = None
+        return hashlib.md5(fingerprint.encode()).hexdigest(), last_modified
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return super().dispatch(request, *args, **kwargs)
+        etag, last_modified = self.validators = self.get_validators()
+        view = condition(
+            etag_func=lambda *args, **kwargs: etag,
+            last_modified_func=lambda *args, **kwargs: last_modified,
+        )(super().dispatch)
+        return view(request, *args, **kwargs)
+
+
+class StaleWhileRevalidateMixin:
+    def dispatch(self, request, *args, **kwargs):
+        if request.method != 'GET' or request.user.is_authenticated:
+            return super().dispatch(request, *args, **kwargs)
+        etag, last_modified = getattr(
+            self, 'validators', None) or self.get_validators()
+        path = request.get_full_path()
+        page = pagecache.get_page(path)
+        if page is not None and page.get('etag') == etag and (
+                time.time() < page['fresh_until']):
+            metrics.incr('page_cache.hits')
+            return self.cached_response(page)
+        if pagecache.acquire_lock(path):
+            try:
+                return self.revalidate(request, path, etag, last_modified,
+                                       *args, **kwargs)
+            finally:
+                pagecache.release_lock(path)
+        if page is None:
+            page = pagecache.wait_for_page(
+                path, settings.PAGE_CACHE_COALESCE_TIMEOUT)
+        if page is None:
+            metrics.incr('page_cache.misses')
+            return super().dispatch(request, *args, **kwargs)
+        metrics.incr('page_cache.stale')
+        return self.cached_response(page)
+
+    def revalidate(self, request, path, etag, last_modified, *args,
+                   **kwargs):
+        started = time.perf_counter()
+        response = super().dispatch(request, *args, **kwargs)
+        if hasattr(response, 'render') and not response.is_rendered:
+            response.render()
+        if pagecache.is_cacheable(request, response):
+            pagecache.store_page(
+                path, response, settings.PAGE_CACHE_TIMEOUT,
+                etag=etag, last_modified=last_modified,
+                fresh_until=time.time() + settings.PAGE_CACHE_FRESH_SECONDS)
+            response.page_cached = True
+        metrics.observe('page_cache.revalidate_ms',
+                        (time.perf_counter() - started) * 1000)
+        return response
+
+    @staticmethod
+    def cached_response(page):
+        response = pagecache.build_response(page)
+        if page.get('etag'):
+            response['ETag'] = quote_etag(page['etag'])
+        if page.get('last_modified'):
+            response['Last-Modified'] = http_date(
+                page['last_modified'].timestamp())
+        response.page_cached = True
+        return response
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 
 class PublishedModel(models.Model):
@@ -12,3 +13,45 @@ class PublishedModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class OutboxMessage(models.Model):
+    PENDING = 'pending'
+    SENDING = 'sending'
+    SENT = 'sent'
+    DEAD = 'dead'
+    STATUS_CHOICES = (
+        (PENDING, 'В очереди'),
+        (SENDING, 'Отправляется'),
+        (SENT, 'Отправлено'),
+        (DEAD, 'Не доставлено'),
+    )
+
+    from_email = models.CharField(max_length=254, verbose_name='Отправитель')
+    recipients = models.TextField(verbose_name='Получатели')
+    subject = models.CharField(max_length=255, blank=True,
+                               verbose_name='Тема')
+    message = models.BinaryField(verbose_name='Письмо')
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES,
+                              default=PENDING, verbose_name='Статус')
+    attempts = models.PositiveSmallIntegerField(default=0,
+                                                verbose_name='Попыток')
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now, verbose_name='Следующая попытка')
+    last_error = models.TextField(blank=True, verbose_name='Ошибка')
+    created_at = models.DateTimeField(auto_now_add=True,
+                                      verbose_name='Добавлено')
+    sent_at = models.DateTimeField(null=True, blank=True,
+                                   verbose_name='Отправлено')
+
+    class Meta:
+        verbose_name = 'письмо в очереди'
+        verbose_name_plural = 'Очередь писем'
+        ordering = ('id',)
+        indexes = (
+            models.Index(fields=('status', 'next_attempt_at'),
+                         name='outbox_due_idx'),
+        )
+
+    def __str__(self):
+        return self.subject
@@ -0,0 +1,65 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import has_vary_header
+
+PAGE_POLL_INTERVAL = 0.05
+
+
+def get_page_key(path):
+    return f'page:{hashlib.md5(path.encode()).hexdigest()}'
+
+
+def get_lock_key(path):
+    return f'{get_page_key(path)}:lock'
+
+
+def acquire_lock(path):
+    return cache.add(get_lock_key(path), 1, settings.PAGE_CACHE_LOCK_TIMEOUT)
+
+
+def release_lock(path):
+    cache.delete(get_lock_key(path))
+
+
+def wait_for_page(path, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(PAGE_POLL_INTERVAL)
+        page = get_page(path)
+        if page is not None:
+            return page
+    return None
+
+
+def is_cacheable(request, response):
+    return (
+        request.method == 'GET'
+        and not request.user.is_authenticated
+        and response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and not request.META.get('CSRF_COOKIE_USED')
+        and not has_vary_header(response, 'Cookie')
+        and response.get('Content-Type', '').startswith('text/html')
+    )
+
+
+def store_page(path, response, timeout, **extra):
+    cache.set(get_page_key(path), dict(
+        extra,
+        content=response.content,
+        content_type=response['Content-Type'],
+        stored_at=time.time(),
+    ), timeout)
+
+
+def get_page(path):
+    return cache.get(get_page_key(path))
+
+
+def build_response(page):
+    return HttpResponse(page['content'], content_type=page['content_type'])
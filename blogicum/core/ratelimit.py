@@ -0,0 +1,115 @@
+import math
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+
+from . import metrics
+
+LOCK_TIMEOUT = 1
+
+LOCK_WAIT = 0.5
+
+LOCK_POLL_INTERVAL = 0.005
+
+
+def too_many_requests(message, retry_after):
+    response = HttpResponse(message, status=429)
+    response['Retry-After'] = retry_after
+    return response
+
+
+def get_buckets(request, scope):
+    limits = settings.RATE_LIMITS.get(scope, {})
+    return {
+        f'ratelimit:{scope}:{kind}:{identity}': limits[kind]
+        for kind, identity in get_identities(request).items()
+        if kind in limits
+    }
+
+
+def acquire_locks(cache, keys):
+    acquired = []
+    deadline = time.monotonic() + LOCK_WAIT
+    for key in sorted(keys):
+        while not cache.add(f'{key}:lock', 1, LOCK_TIMEOUT):
+            if time.monotonic() >= deadline:
+                release_locks(cache, acquired)
+                return None
+            time.sleep(LOCK_POLL_INTERVAL)
+        acquired.append(key)
+    return acquired
+
+
+def release_locks(cache, keys):
+    cache.delete_many([f'{key}:lock' for key in keys])
+
+
+def take_tokens(buckets):
+    cache = caches[settings.RATE_LIMIT_CACHE]
+    locked = acquire_locks(cache, buckets)
+    if locked is None:
+        return 1
+    try:
+        now = time.time()
+        arrivals = cache.get_many(buckets)
+        retry_after = 0
+        updated = {}
+        for key, (capacity, period) in buckets.items():
+            interval = period / capacity
+            arrival = max(arrivals.get(key, now), now) + interval
+            wait = arrival - now - period
+            if wait > 0:
+                retry_after = max(retry_after, math.ceil(wait))
+            updated[key] = arrival
+        if not retry_after:
+            for key, arrival in updated.items():
+                cache.set(key, arrival, math.ceil(arrival - now) + 1)
+        return retry_after
+    finally:
+        release_locks(cache, locked)
+
+
+def get_identities(request):
+    identities = {'ip': request.META.get('REMOTE_ADDR', '')}
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        identities['user'] = user.pk
+    return identities
+
+
+def check_rate_limit(request, scope):
+    retry_after = take_tokens(get_buckets(request, scope))
+    metrics.incr(
+        f'ratelimit.{scope}.{"limited" if retry_after else "allowed"}')
+    return retry_after
+
+
+def rate_limited_response(request, scope):
+    if request.method != 'POST':
+        return None
+    retry_after = check_rate_limit(request, scope)
+    if not retry_after:
+        return None
+    return too_many_requests(
+        'Слишком много запросов, попробуйте позже.', retry_after)
+
+
+def rate_limit(scope):
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            return (rate_limited_response(request, scope)
+                    or view(request, *args, **kwargs))
+        return wrapper
+    return decorator
+
+
+class RateLimitMixin:
+    rate_limit_scope = None
+
+    def dispatch(self, request, *args, **kwargs):
+        return (rate_limited_response(request, self.rate_limit_scope)
+                or super().dispatch(request, *args, **kwargs))
@@ -0,0 +1,42 @@
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+PRIMARY_ONLY_APPS = ('sessions',)
+
+_replica_reads = ContextVar('replica_reads', default=False)
+
+
+def replica_reads_enabled():
+    return _replica_reads.get()
+
+
+@contextmanager
+def use_replica():
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def replica_for(request):
+    if request.COOKIES.get(settings.REPLICA_STICKY_COOKIE):
+        return nullcontext()
+    return use_replica()
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if (settings.REPLICA_DATABASE and replica_reads_enabled()
+                and model._meta.app_label not in PRIMARY_ONLY_APPS):
+            return settings.REPLICA_DATABASE
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
@@ -0,0 +1,192 @@
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import (FileResponse, HttpResponse,
+                         HttpResponseNotModified)
+from django.utils._os import safe_join
+from django.utils.http import http_date, parse_http_date_safe
+
+from .compression import parse_accept_encoding
+from .storage import ENCODING_SUFFIXES
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class FileEntry:
+    __slots__ = ('path', 'size', 'mtime', 'content_type', 'cache_control',
+                 'variants')
+
+    def __init__(self, path, cache_control):
+        stat = os.stat(path)
+        self.path = path
+        self.size = stat.st_size
+        self.mtime = int(stat.st_mtime)
+        content_type, _ = mimetypes.guess_type(path)
+        self.content_type = content_type or 'application/octet-stream'
+        self.cache_control = cache_control
+        self.variants = {
+            encoding: (path + suffix, os.path.getsize(path + suffix))
+            for encoding, suffix in ENCODING_SUFFIXES.items()
+            if os.path.isfile(path + suffix)
+        }
+
+    def etag(self, encoding=None):
+        suffix = f'-{encoding}' if encoding else ''
+        return f'"{self.mtime:x}-{self.size:x}{suffix}"'
+
+
+class RangeFile:
+    def __init__(self, file, length):
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+def build_static_index():
+    root = settings.STATIC_ROOT
+    index = {}
+    if not root or not os.path.isdir(root):
+        return index
+    is_immutable = getattr(
+        staticfiles_storage, 'is_immutable', lambda name: False)
+    suffixes = tuple(ENCODING_SUFFIXES.values())
+    for directory, _, files in os.walk(root):
+        for filename in files:
+            if filename.endswith(suffixes):
+                continue
+            path = os.path.join(directory, filename)
+            name = os.path.relpath(path, root).replace(os.sep, '/')
+            cache_control = (
+                IMMUTABLE_CACHE_CONTROL if is_immutable(name)
+                else f'public, max-age={settings.STATIC_CACHE_SECONDS}'
+            )
+            index[settings.STATIC_URL + name] = FileEntry(path, cache_control)
+    return index
+
+
+def find_media(path):
+    if not settings.MEDIA_ROOT or not path.startswith(settings.MEDIA_URL):
+        return None
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT,
+                              path[len(settings.MEDIA_URL):])
+    except SuspiciousFileOperation:
+        return None
+    if not os.path.isfile(full_path):
+        return None
+    return FileEntry(
+        full_path, f'public, max-age={settings.MEDIA_CACHE_SECONDS}')
+
+
+def select_variant(request, entry):
+    accepted = parse_accept_encoding(
+        request.META.get('HTTP_ACCEPT_ENCODING', ''))
+    for encoding in ENCODING_SUFFIXES:
+        if encoding in accepted and encoding in entry.variants:
+            path, size = entry.variants[encoding]
+            return path, size, encoding
+    return entry.path, entry.size, None
+
+
+def parse_range(header, size):
+    match = RANGE_RE.match(header.strip())
+    if not match or not any(match.groups()):
+        return None
+    start, end = match.groups()
+    if not start:
+        length = min(int(end), size)
+        if not length:
+            return None
+        return size - length, size - 1
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start > end:
+        return None
+    return start, end
+
+
+def is_not_modified(request, entry, etag):
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match is not None:
+        return etag in (
+            tag.strip().replace('W/', '') for tag in if_none_match.split(',')
+        ) or if_none_match.strip() == '*'
+    since = parse_http_date_safe(
+        request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+    return since is not None and entry.mtime <= since
+
+
+def wants_range(request, entry):
+    if 'HTTP_RANGE' not in request.META or ',' in request.META['HTTP_RANGE']:
+        return False
+    if_range = request.META.get('HTTP_IF_RANGE')
+    return if_range is None or if_range == entry.etag()
+
+
+def serve_file(request, entry):
+    if wants_range(request, entry):
+        path, size, encoding = entry.path, entry.size, None
+    else:
+        path, size, encoding = select_variant(request, entry)
+    etag = entry.etag(encoding)
+    headers = {
+        'ETag': etag,
+        'Last-Modified': http_date(entry.mtime),
+        'Cache-Control': entry.cache_control,
+        'Vary': 'Accept-Encoding',
+        'Accept-Ranges': 'bytes',
+    }
+    if is_not_modified(request, entry, etag):
+        response = HttpResponseNotModified()
+    elif wants_range(request, entry):
+        response = serve_range(request, entry)
+    elif request.method == 'HEAD':
+        response = HttpResponse(content_type=entry.content_type)
+        response['Content-Length'] = size
+    else:
+        response = FileResponse(open(path, 'rb'),
+                                content_type=entry.content_type)
+        response['Content-Length'] = size
+    if encoding and response.status_code == 200:
+        response['Content-Encoding'] = encoding
+    for header, value in headers.items():
+        response[header] = value
+    return response
+
+
+def serve_range(request, entry):
+    byte_range = parse_range(request.META['HTTP_RANGE'], entry.size)
+    if byte_range is None:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{entry.size}'
+        return response
+    start, end = byte_range
+    length = end - start + 1
+    if request.method == 'HEAD':
+        response = HttpResponse(content_type=entry.content_type, status=206)
+    else:
+        file = open(entry.path, 'rb')
+        file.seek(start)
+        response = FileResponse(RangeFile(file, length),
+                                content_type=entry.content_type, status=206)
+    response['Content-Length'] = length
+    response['Content-Range'] = f'bytes {start}-{end}/{entry.size}'
+    return response
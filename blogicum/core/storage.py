@@ -0,0 +1,58 @@
+import gzip
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = (
+    '.css', '.js', '.svg', '.ico', '.txt', '.html', '.json', '.map', '.xml',
+)
+
+
+ENCODING_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+
+def get_encodings():
+    encodings = {'gzip': ('.gz', lambda data: gzip.compress(
+        data, compresslevel=9, mtime=0))}
+    if brotli is not None:
+        encodings['br'] = ('.br', lambda data: brotli.compress(
+            data, quality=11))
+    return encodings
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    def stored_name(self, name):
+        if not self.hashed_files:
+            return name
+        return super().stored_name(name)
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+        for hashed_name in sorted(set(self.hashed_files.values())):
+            if hashed_name.endswith(COMPRESSIBLE_EXTENSIONS):
+                self.compress(hashed_name)
+
+    def compress(self, name):
+        with self.open(name) as file:
+            data = file.read()
+        for suffix, compress in get_encodings().values():
+            compressed = compress(data)
+            if len(compressed) < len(data):
+                self.delete(name + suffix)
+                self._save(name + suffix, ContentFile(compressed))
+
+    def is_immutable(self, name):
+        return name in self.hashed_names
+
+    @property
+    def hashed_names(self):
+        if not hasattr(self, '_hashed_names'):
+            self._hashed_names = set(self.hashed_files.values())
+        return self._hashed_names
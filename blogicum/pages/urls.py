@@ -1,12 +1,13 @@
 from django.urls import path
-from django.views.generic import TemplateView
+
+from .views import StaticPage
 
 app_name = 'pages'
 
 
 urlpatterns = [
-    path('about/', TemplateView.as_view(template_name='pages/about.html'),
+    path('about/', StaticPage.as_view(template_name='pages/about.html'),
          name='about'),
-    path('rules/', TemplateView.as_view(template_name='pages/rules.html'),
+    path('rules/', StaticPage.as_view(template_name='pages/rules.html'),
          name='rules')
 ]
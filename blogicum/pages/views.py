@@ -1,4 +1,11 @@
 from django.shortcuts import render
+from django.views.generic import TemplateView
+
+from core.mixins import ReadReplicaMixin
+
+
+class StaticPage(ReadReplicaMixin, TemplateView):
+    pass
 
 
 def page_not_found(request, exception):
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import re
 import time
@@ -18,6 +19,7 @@ from typing import (
 
 import pytest
 from django.apps import apps
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db.models import Model, Field
 from django.forms import BaseForm
@@ -41,6 +43,24 @@ def enable_debug_false():
         yield
 
 
+@pytest.fixture(autouse=True)
+def isolate_view_counts(tmp_path):
+    from blog.viewcounts import buffer
+
+    buffer.drain()
+    with override_settings(VIEW_COUNTS_SPOOL=tmp_path / "view_counts.spool"):
+        yield
+    buffer.drain()
+
+
+@pytest.fixture(autouse=True)
+def isolate_session_cache(tmp_path):
+    caches = dict(settings.CACHES, sessions=dict(
+        settings.CACHES["sessions"], LOCATION=tmp_path / "session_cache"))
+    with override_settings(CACHES=caches):
+        yield
+
+
 class SafeImportFromContextManager:
     def __init__(
             self,
@@ -340,6 +360,28 @@ def squash_code(code: str) -> str:
     return result
 
 
+def asgi_get(path):
+    from blogicum.asgi import application
+
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    path, _, query = path.partition("?")
+    scope = {
+        "type": "http", "method": "GET", "path": path,
+        "query_string": query.encode(),
+        "headers": [(b"host", b"localhost")],
+    }
+    asyncio.run(application(scope, receive, send))
+    body = b"".join(message.get("body", b"") for message in messages[1:])
+    return messages[0]["status"], body
+
+
 def get_field_key(field_type: type, field: Field) -> Tuple[str, Optional[str]]:
     if field.is_relation:
         return (field_type.__name__, field.related_model.__name__)
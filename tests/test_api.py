@@ -0,0 +1,91 @@
+import base64
+import json
+from http import HTTPStatus
+
+import pytest
+
+from conftest import asgi_get
+
+
+def get_json(client, url, **params):
+    response = client.get(url, params)
+    content = b"".join(response.streaming_content) if response.streaming \
+        else response.content
+    return response.status_code, json.loads(content)
+
+
+@pytest.mark.django_db
+def test_posts_cursor_pagination(
+        client, many_posts_with_published_locations, future_posts):
+    ids, cursor = [], None
+    while True:
+        params = {"limit": 7, "fields": "id,title"}
+        if cursor:
+            params["cursor"] = cursor
+        status, data = get_json(client, "/api/posts/", **params)
+        assert status == HTTPStatus.OK
+        for item in data["results"]:
+            assert set(item) == {"id", "title"}, (
+                "Убедитесь, что API возвращает только запрошенные поля."
+            )
+            ids.append(item["id"])
+        cursor = data["next"]
+        if cursor is None:
+            break
+    expected = sorted(
+        many_posts_with_published_locations,
+        key=lambda post: (post.pub_date, post.id), reverse=True,
+    )
+    assert ids == [post.id for post in expected], (
+        "Убедитесь, что курсорная пагинация обходит все опубликованные"
+        " посты по порядку без пропусков и повторов."
+    )
+
+
+@pytest.mark.django_db
+def test_api_rejects_unknown_fields(client):
+    status, data = get_json(client, "/api/posts/", fields="id,password")
+    assert status == HTTPStatus.BAD_REQUEST and "error" in data
+
+
+@pytest.mark.django_db
+def test_api_hides_unpublished_posts(client, future_posts):
+    status, _ = get_json(client, f"/api/posts/{future_posts[0].id}/")
+    assert status == HTTPStatus.NOT_FOUND
+    status, _ = get_json(
+        client, f"/api/posts/{future_posts[0].id}/comments/")
+    assert status == HTTPStatus.NOT_FOUND, (
+        "Убедитесь, что комментарии к неопубликованным постам недоступны"
+        " через API."
+    )
+
+
+@pytest.mark.django_db
+def test_api_post_comments(client, comment_to_a_post):
+    post_id = comment_to_a_post.post.id
+    status, data = get_json(client, f"/api/posts/{post_id}/comments/")
+    assert status == HTTPStatus.OK
+    assert [item["text"] for item in data["results"]] == [
+        comment_to_a_post.text
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("values", ([{"a": 1}, [2]], [None, 1], "курсор"))
+def test_api_rejects_malformed_cursor(client, values):
+    cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+    status, data = get_json(client, "/api/posts/", cursor=cursor)
+    assert status == HTTPStatus.BAD_REQUEST, (
+        "Убедитесь, что курсор неверной структуры отклоняется с кодом 400."
+    )
+    assert "error" in data
+
+
+@pytest.mark.django_db(transaction=True)
+def test_api_posts_under_asgi(many_posts_with_published_locations):
+    status, content = asgi_get("/api/posts/?limit=3")
+    assert status == HTTPStatus.OK, (
+        "Убедитесь, что список публикаций API отдаётся под ASGI."
+    )
+    data = json.loads(content)
+    assert len(data["results"]) == 3 and data["next"]
@@ -0,0 +1,37 @@
+import pytest
+
+from blog.constants import COMMENTS_STREAM_THRESHOLD
+from blog.models import Comment
+from conftest import asgi_get
+
+
+@pytest.mark.django_db(transaction=True)
+def test_read_pages_served_under_asgi(post_with_published_location):
+    post = post_with_published_location
+    for url in (
+        "/",
+        f"/posts/{post.id}/",
+        f"/category/{post.category.slug}/",
+        f"/profile/{post.author.username}/",
+        "/pages/about/",
+    ):
+        status, _ = asgi_get(url)
+        assert status == 200, (
+            f"Убедитесь, что страница `{url}` отдаётся под ASGI."
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_long_thread_streamed_under_asgi(
+        user, post_with_published_location):
+    post = post_with_published_location
+    Comment.objects.bulk_create(
+        Comment(post=post, author=user, text=f"Комментарий №{number}")
+        for number in range(COMMENTS_STREAM_THRESHOLD)
+    )
+    status, content = asgi_get(f"/posts/{post.id}/")
+    assert status == 200, (
+        "Убедитесь, что длинная ветка комментариев отдаётся под ASGI."
+    )
+    assert f"Комментарий №{COMMENTS_STREAM_THRESHOLD - 1}" in (
+        content.decode())
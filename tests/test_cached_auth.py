@@ -0,0 +1,71 @@
+import pytest
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def get_tables(queries):
+    return " ".join(query["sql"] for query in queries)
+
+
+@pytest.mark.django_db
+def test_logged_in_page_skips_session_and_user_queries(user_client):
+    user_client.get("/")
+    with CaptureQueriesContext(connection) as queries:
+        response = user_client.get("/")
+    assert response.status_code == 200
+    sql = get_tables(queries.captured_queries)
+    assert "django_session" not in sql, (
+        "Убедитесь, что сессии читаются из кеша, а не из базы данных."
+    )
+    assert 'FROM "auth_user"' not in sql, (
+        "Убедитесь, что пользователь сессии берётся из кеша."
+    )
+
+
+@pytest.mark.django_db
+def test_cached_user_invalidated_on_deactivation_and_password_change(
+        user, user_client):
+    user_client.get("/")
+    user.is_active = False
+    user.save()
+    response = user_client.get("/")
+    assert not response.wsgi_request.user.is_authenticated, (
+        "Убедитесь, что деактивированный пользователь не берётся из кеша."
+    )
+    user.is_active = True
+    user.set_password("новый-пароль-123")
+    user.save()
+    response = user_client.get("/")
+    assert not response.wsgi_request.user.is_authenticated, (
+        "Убедитесь, что после смены пароля сессия из кеша не принимается."
+    )
+
+
+@pytest.mark.django_db
+def test_session_unusable_after_logout(user_client):
+    user_client.get("/")
+    session_cookie = user_client.cookies[settings.SESSION_COOKIE_NAME].value
+    user_client.post("/auth/logout/")
+    user_client.cookies[settings.SESSION_COOKIE_NAME] = session_cookie
+    response = user_client.get("/")
+    assert not response.wsgi_request.user.is_authenticated, (
+        "Убедитесь, что после выхода закешированная сессия не принимается."
+    )
+
+
+@pytest.mark.django_db
+def test_cached_user_invalidated_on_profile_edit(user, user_client):
+    user_client.get("/")
+    response = user_client.post("/edit_profile/", {
+        "username": "renamed_user",
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "email": "renamed@example.com",
+    })
+    assert response.status_code == 302
+    content = user_client.get("/").content.decode()
+    assert "renamed_user" in content, (
+        "Убедитесь, что после редактирования профиля кешированный"
+        " пользователь сбрасывается."
+    )
@@ -0,0 +1,66 @@
+import gzip
+import json
+
+import pytest
+from django.test import override_settings
+
+from core import metrics
+
+
+@pytest.mark.django_db
+def test_html_compressed(client, many_posts_with_published_locations):
+    plain = client.get("/")
+    metrics.reset()
+    response = client.get("/", HTTP_ACCEPT_ENCODING="gzip, br;q=0")
+    assert response["Content-Encoding"] == "gzip", (
+        "Убедитесь, что HTML-страницы отдаются в сжатом виде, если клиент"
+        " поддерживает gzip."
+    )
+    assert "Accept-Encoding" in response["Vary"]
+    assert gzip.decompress(response.content) == plain.content
+    assert int(response["Content-Length"]) < len(plain.content)
+    assert "compress;dur=" in response["Server-Timing"], (
+        "Убедитесь, что затраты на сжатие видны в заголовке"
+        " `Server-Timing`."
+    )
+    timings = metrics.snapshot()["timings"]
+    assert "compression.gzip.level_6.cpu_ms" in timings
+
+
+@pytest.mark.django_db
+def test_streaming_compressed(client, many_posts_with_published_locations):
+    response = client.get("/api/posts/", HTTP_ACCEPT_ENCODING="gzip")
+    assert response.streaming
+    assert response["Content-Encoding"] == "gzip"
+    assert not response.has_header("Content-Length")
+    data = json.loads(gzip.decompress(b"".join(response.streaming_content)))
+    assert data["results"], (
+        "Убедитесь, что потоковые ответы корректно сжимаются по частям."
+    )
+
+
+@pytest.mark.django_db
+def test_csrf_pages_padded(client):
+    sizes = set()
+    for _ in range(5):
+        response = client.get("/auth/login/", HTTP_ACCEPT_ENCODING="gzip")
+        assert response["Content-Encoding"] == "gzip"
+        assert response.content[3] & gzip.FNAME, (
+            "Убедитесь, что страницы с CSRF-токеном сжимаются со случайным"
+            " дополнением для защиты от BREACH."
+        )
+        assert b"csrfmiddlewaretoken" in gzip.decompress(response.content)
+        sizes.add(len(response.content))
+    assert len(sizes) > 1
+
+
+@pytest.mark.django_db
+def test_small_responses_not_compressed(client):
+    with override_settings(COMPRESSION_MIN_SIZE=10 ** 6):
+        response = client.get("/", HTTP_ACCEPT_ENCODING="gzip")
+    assert not response.has_header("Content-Encoding"), (
+        "Убедитесь, что ответы меньше порога `COMPRESSION_MIN_SIZE`"
+        " не сжимаются."
+    )
+    response = client.get("/", HTTP_ACCEPT_ENCODING="identity")
+    assert not response.has_header("Content-Encoding")
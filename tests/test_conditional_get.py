@@ -0,0 +1,120 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from blog.models import FeedChange, Post
+
+
+@pytest.mark.django_db
+def test_feed_not_modified(
+        client, many_posts_with_published_locations):
+    response = client.get("/")
+    etag = response.get("ETag")
+    assert etag and response.has_header("Last-Modified"), (
+        "Убедитесь, что главная страница отдаёт заголовки `ETag` и"
+        " `Last-Modified`."
+    )
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get("/", HTTP_IF_NONE_MATCH=etag)
+    assert len(queries) == 1 and "blog_comment" not in queries[0]["sql"], (
+        "Убедитесь, что проверка `If-None-Match` выполняется одним дешёвым"
+        " запросом без обхода публикаций и комментариев."
+    )
+    assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+        "Убедитесь, что при совпадении `If-None-Match` главная страница"
+        " возвращает `304 Not Modified` без выполнения основного запроса."
+    )
+    assert not response.templates
+
+
+@pytest.mark.django_db
+def test_post_etag_tracks_comments(
+        user_client, post_with_published_location, comment_to_a_post):
+    url = f"/posts/{post_with_published_location.id}/"
+    user_client.get(url)
+    etag = user_client.get(url)["ETag"]
+    assert user_client.get(
+        url, HTTP_IF_NONE_MATCH=etag
+    ).status_code == HTTPStatus.NOT_MODIFIED
+    comment_to_a_post.text = "Исправленный текст"
+    comment_to_a_post.save()
+    response = user_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK, (
+        "Убедитесь, что после изменения комментария страница публикации"
+        " отдаётся заново."
+    )
+
+
+@pytest.mark.django_db
+def test_etag_depends_on_user(
+        client, user_client, post_with_published_location):
+    url = f"/posts/{post_with_published_location.id}/"
+    etag = client.get(url)["ETag"]
+    response = user_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK, (
+        "Убедитесь, что `ETag` различается для анонимного и"
+        " авторизованного пользователя."
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("change", ["unpublish", "delete"])
+def test_feed_modified_after_post_removed(
+        client, many_posts_with_published_locations, change):
+    past = timezone.now() - timedelta(days=1)
+    Post.objects.update(pub_date=past, updated_at=past)
+    FeedChange.objects.all().delete()
+    last_modified = client.get("/")["Last-Modified"]
+    post = Post.objects.first()
+    if change == "unpublish":
+        post.is_published = False
+        post.save()
+    else:
+        post.delete()
+    response = client.get("/", HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == HTTPStatus.OK, (
+        "Убедитесь, что после снятия публикации или удаления поста"
+        " `Last-Modified` ленты обновляется."
+    )
+
+
+@pytest.mark.django_db
+def test_feed_etag_tracks_category(
+        client, published_category, many_posts_with_published_locations):
+    etag = client.get("/")["ETag"]
+    published_category.title = "Новое название"
+    published_category.save()
+    response = client.get("/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK, (
+        "Убедитесь, что после изменения категории лента отдаётся заново."
+    )
+
+
+@pytest.mark.django_db
+def test_feed_etag_tracks_scheduled_post(
+        client, many_posts_with_published_locations):
+    Post.objects.filter(pk=many_posts_with_published_locations[0].pk).update(
+        pub_date=timezone.now() + timedelta(hours=1))
+    etag = client.get("/")["ETag"]
+    Post.objects.filter(pk=many_posts_with_published_locations[0].pk).update(
+        pub_date=timezone.now() - timedelta(seconds=1))
+    response = client.get("/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK, (
+        "Убедитесь, что лента обновляется, когда наступает время"
+        " отложенной публикации."
+    )
+
+
+@pytest.mark.django_db
+def test_feed_etag_tracks_comments(
+        client, post_with_published_location, comment_to_a_post):
+    etag = client.get("/")["ETag"]
+    comment_to_a_post.delete()
+    response = client.get("/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK, (
+        "Убедитесь, что после удаления комментария лента отдаётся заново."
+    )
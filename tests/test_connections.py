@@ -0,0 +1,53 @@
+from http import HTTPStatus
+
+import pytest
+from django.test import Client
+
+from core import db, metrics
+
+
+class StubConnection:
+    settings_dict = {"CONN_HEALTH_CHECKS": True}
+
+    def __init__(self, usable):
+        self.connection = object()
+        self.usable = usable
+        self.closed = False
+
+    def is_usable(self):
+        return self.usable
+
+    def close(self):
+        self.closed = True
+
+
+def test_reused_connections_health_checked(monkeypatch):
+    healthy, broken = StubConnection(True), StubConnection(False)
+    monkeypatch.setattr(db.connections, "all", lambda: [healthy, broken])
+    metrics.reset()
+    db.check_reused_connections()
+    counters = metrics.snapshot()["counters"]
+    assert broken.closed and not healthy.closed, (
+        "Убедитесь, что при начале запроса закрываются только соединения,"
+        " не прошедшие проверку работоспособности."
+    )
+    assert counters == {
+        "db.connections.reused": 1,
+        "db.connections.failed": 1,
+    }, "Убедитесь, что статистика пула соединений попадает в метрики."
+
+
+@pytest.mark.django_db
+def test_metrics_visible_to_staff_only(mixer, user_client):
+    response = user_client.get("/metrics/")
+    assert response.status_code == HTTPStatus.FOUND, (
+        "Убедитесь, что метрики недоступны обычным пользователям."
+    )
+    staff_client = Client()
+    staff_client.force_login(mixer.blend("auth.User", is_staff=True))
+    response = staff_client.get("/metrics/")
+    assert response.status_code == HTTPStatus.OK
+    assert "db.connections.reused" in response.json()["counters"], (
+        "Убедитесь, что число переиспользованных соединений видно в"
+        " метриках."
+    )
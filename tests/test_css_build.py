@@ -0,0 +1,67 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+
+from core.css import Usage, prune_css, scan_templates
+
+
+def test_prune_css_keeps_used_rules():
+    css = (
+        '@charset "UTF-8";.card{a:1}.modal{b:2}h1,.h1{c:3}'
+        '@media (min-width:576px){.modal{d:4}.card{e:5}}'
+        '.btn:not(.disabled):hover{f:6}@keyframes spin{0%{g:7}}'
+    )
+    pruned = prune_css(css, Usage({'card', 'btn'}))
+    assert pruned == (
+        '@charset "UTF-8";.card{a:1}h1{c:3}'
+        '@media (min-width:576px){.card{e:5}}'
+        '.btn:not(.disabled):hover{f:6}'
+    ), (
+        "Убедитесь, что из таблицы стилей удаляются правила для классов,"
+        " которые не встречаются в шаблонах."
+    )
+    critical = prune_css(css, Usage({'card'}, {'p'}), standalone=False)
+    assert critical == '.card{a:1}@media (min-width:576px){.card{e:5}}'
+
+
+def test_scan_templates_reads_conditional_classes(tmp_path):
+    template = tmp_path / "nav.html"
+    template.write_text(
+        "<a class=\"nav-link {% if view_name == 'pages:about' %}"
+        " text-white {% endif %}\" href='#'>О проекте</a>"
+        "<span class='badge'></span>",
+        encoding="utf-8",
+    )
+    classes, tags = scan_templates([template])
+    assert classes == {"nav-link", "text-white", "badge"}, (
+        "Убедитесь, что классы внутри условных тегов шаблона не теряются"
+        " при поиске используемых классов."
+    )
+    assert tags == {"a", "span"}
+
+
+@pytest.mark.django_db
+def test_build_css_command(tmp_path, client):
+    pruned, critical = tmp_path / "pruned.css", tmp_path / "critical.html"
+    with override_settings(CSS_PRUNED_OUTPUT=pruned,
+                           CSS_CRITICAL_OUTPUT=critical):
+        call_command("build_css", stdout=StringIO())
+    css = pruned.read_text()
+    assert ".card-body{" in css and ".carousel" not in css
+    assert ".text-white{" in css and ".text-white{" in critical.read_text(), (
+        "Убедитесь, что стиль активного пункта меню `.text-white`"
+        " сохраняется в урезанном и критическом CSS."
+    )
+    assert len(css) < 40 * 1024
+    assert len(critical.read_text()) < 10 * 1024, (
+        "Убедитесь, что критический CSS занимает не больше нескольких"
+        " килобайт."
+    )
+    content = client.get("/").content.decode()
+    assert "<style>" in content and "bootstrap.pruned.css" in content, (
+        "Убедитесь, что критический CSS встроен в `base.html`, а урезанная"
+        " таблица стилей подключается отдельно."
+    )
+    assert "cdn.jsdelivr.net" not in content
@@ -0,0 +1,45 @@
+import pytest
+from django.conf import settings
+from django.db import connection
+from django.test import override_settings
+
+from core.db import apply_sqlite_pragmas
+
+
+def read_pragma(name):
+    with connection.cursor() as cursor:
+        cursor.execute(f"PRAGMA {name}")
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db
+def test_sqlite_pragmas_applied_on_connect():
+    assert read_pragma("busy_timeout") == (
+        settings.SQLITE_PRAGMAS["busy_timeout"]
+    ), (
+        "Убедитесь, что при открытии соединения с SQLite применяется"
+        " `busy_timeout` из настройки `SQLITE_PRAGMAS`."
+    )
+    assert read_pragma("temp_store") == 2, (
+        "Убедитесь, что при открытии соединения с SQLite применяется"
+        " `temp_store=MEMORY`."
+    )
+
+
+@pytest.mark.django_db
+def test_sqlite_pragmas_configurable():
+    with override_settings(SQLITE_PRAGMAS={"busy_timeout": 1234}):
+        apply_sqlite_pragmas(sender=None, connection=connection)
+    assert read_pragma("busy_timeout") == 1234, (
+        "Убедитесь, что набор PRAGMA задаётся настройкой `SQLITE_PRAGMAS`."
+    )
+    restore = {"busy_timeout": settings.SQLITE_PRAGMAS["busy_timeout"]}
+    with override_settings(SQLITE_PRAGMAS=restore):
+        apply_sqlite_pragmas(sender=None, connection=connection)
+
+
+@pytest.mark.django_db
+def test_sqlite_pragmas_reject_bad_names():
+    with override_settings(SQLITE_PRAGMAS={"x; DROP TABLE": 1}):
+        with pytest.raises(ValueError):
+            apply_sqlite_pragmas(sender=None, connection=connection)
@@ -0,0 +1,78 @@
+import csv
+import json
+
+import pytest
+from django.core.management import call_command
+
+
+def read_ndjson(path):
+    with open(path, encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+@pytest.mark.django_db
+def test_export_ndjson_resumes_from_checkpoint(
+        tmp_path, mixer, post_with_published_location, comment_to_a_post):
+    output, checkpoint = tmp_path / "dump.ndjson", tmp_path / "ckpt.json"
+    call_command("export_content", output=str(output),
+                 checkpoint=str(checkpoint), chunk_size=1)
+    records = read_ndjson(output)
+    posts = [item for item in records if item["model"] == "blog.post"]
+    assert [item["pk"] for item in posts] == [
+        post_with_published_location.id
+    ], "Убедитесь, что публикации выгружаются в формате фикстур."
+    assert posts[0]["fields"]["author"] == (
+        post_with_published_location.author_id
+    )
+    new_comment = mixer.blend(
+        "blog.Comment", post=post_with_published_location)
+    call_command("export_content", output=str(output),
+                 checkpoint=str(checkpoint), models=["comments"])
+    comments = [
+        item["pk"] for item in read_ndjson(output)
+        if item["model"] == "blog.comment"
+    ]
+    assert comments == [comment_to_a_post.id, new_comment.id], (
+        "Убедитесь, что при возобновлении по контрольной точке"
+        " выгружаются только новые записи."
+    )
+
+
+@pytest.mark.django_db
+def test_export_csv(tmp_path, post_with_published_location):
+    call_command("export_content", output=str(tmp_path), format="csv",
+                 models=["posts"])
+    with open(tmp_path / "posts.csv", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert [row["title"] for row in rows] == [
+        post_with_published_location.title
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("export_format", ["ndjson", "csv"])
+def test_export_resume_drops_unfinished_chunk(
+        tmp_path, mixer, comment_to_a_post, export_format):
+    checkpoint = tmp_path / "ckpt.json"
+    if export_format == "csv":
+        output = tmp_path / "csv"
+        path = output / "comments.csv"
+    else:
+        output = path = tmp_path / "dump.ndjson"
+    options = dict(output=str(output), format=export_format,
+                   checkpoint=str(checkpoint), models=["comments"])
+    call_command("export_content", **options)
+    exported = path.read_text(encoding="utf-8")
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(exported.splitlines()[-1][:10])
+    new_comment = mixer.blend("blog.Comment", post=comment_to_a_post.post)
+    call_command("export_content", **options)
+    with open(path, encoding="utf-8") as file:
+        if export_format == "csv":
+            pks = [int(row["pk"]) for row in csv.DictReader(file)]
+        else:
+            pks = [json.loads(line)["pk"] for line in file]
+    assert pks == [comment_to_a_post.id, new_comment.id], (
+        "Убедитесь, что при возобновлении выгрузки строки незавершённой"
+        " порции отбрасываются."
+    )
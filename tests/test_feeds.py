@@ -0,0 +1,49 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", ["/feed/rss/", "/feed/atom/"])
+def test_feed_lists_published_posts_only(
+        client, url, post_with_published_location, future_posts,
+        posts_with_unpublished_category):
+    response = client.get(url)
+    assert response.status_code == HTTPStatus.OK
+    content = response.content.decode()
+    assert post_with_published_location.title in content, (
+        "Убедитесь, что в ленту попадают опубликованные посты."
+    )
+    for post in future_posts + posts_with_unpublished_category:
+        assert post.title not in content, (
+            "Убедитесь, что лента использует правила публикации постов."
+        )
+
+
+@pytest.mark.django_db
+def test_feed_served_from_cache(
+        client, post_with_published_location, django_assert_max_num_queries):
+    url = f"/category/{post_with_published_location.category.slug}/feed/rss/"
+    first = client.get(url)
+    with django_assert_max_num_queries(1):
+        second = client.get(url)
+    assert second.content == first.content, (
+        "Убедитесь, что повторный запрос ленты отдаётся из кеша."
+    )
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+    assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+        "Убедитесь, что лента поддерживает условные GET-запросы."
+    )
+    assert len(queries) == 1 and "blog_comment" not in queries[0]["sql"], (
+        "Убедитесь, что опрос неизменной ленты стоит один дешёвый запрос."
+    )
+
+
+@pytest.mark.django_db
+def test_feed_unknown_author(client):
+    assert client.get("/profile/nobody/feed/atom/").status_code == (
+        HTTPStatus.NOT_FOUND
+    )
@@ -0,0 +1,39 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from blog.models import Comment, Post
+
+
+@pytest.mark.django_db
+def test_generate_content_volumes_and_variety():
+    call_command(
+        "generate_content", users=5, categories=3, locations=4, posts=200,
+        comments=500, future_ratio=0.2, unpublished_ratio=0.2, seed=7,
+        batch_size=64,
+    )
+    assert Post.objects.count() == 200 and Comment.objects.count() == 500, (
+        "Убедитесь, что генератор создаёт заданное число записей."
+    )
+    assert Post.objects.filter(pub_date__gt=timezone.now()).exists(), (
+        "Убедитесь, что генератор создаёт отложенные публикации."
+    )
+    assert Post.objects.filter(is_published=False).exists(), (
+        "Убедитесь, что генератор создаёт снятые с публикации посты."
+    )
+    assert not Comment.objects.filter(created_at__gt=timezone.now()).exists()
+    week_ago = timezone.now() - timedelta(days=7)
+    assert Post.objects.filter(created_at__lt=week_ago).exists() and (
+        Comment.objects.filter(created_at__lt=week_ago).exists()
+    ), (
+        "Убедитесь, что генератор сохраняет заданные временные метки."
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("option", ["users", "categories"])
+def test_generate_content_requires_users_and_categories(option):
+    with pytest.raises(CommandError):
+        call_command("generate_content", posts=1, comments=0, **{option: 0})
@@ -0,0 +1,88 @@
+import json
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from blog.models import Comment, Post
+
+
+@pytest.mark.django_db
+def test_export_import_roundtrip(tmp_path, comment_to_a_post):
+    post = comment_to_a_post.post
+    dump = tmp_path / "dump.ndjson"
+    call_command("export_content", output=str(dump))
+    Post.objects.all().delete()
+    call_command("import_content", str(dump), batch_size=2,
+                 ignore_conflicts=True)
+    restored = Post.objects.get(pk=post.pk)
+    delta = abs(restored.created_at - post.created_at)
+    assert (restored.title, restored.author_id) == (
+        post.title, post.author_id
+    ) and delta < timedelta(milliseconds=1), (
+        "Убедитесь, что импорт восстанавливает публикации без изменения"
+        " полей, включая временные метки."
+    )
+    assert Comment.objects.filter(pk=comment_to_a_post.id).exists()
+
+
+@pytest.mark.django_db
+def test_import_fixture_array(tmp_path, user, published_category):
+    fixture = tmp_path / "fixture.json"
+    fixture.write_text(json.dumps([
+        {"model": "sessions.session", "pk": "x", "fields": {}},
+        {
+            "model": "blog.post",
+            "pk": 9001,
+            "fields": {
+                "is_published": True,
+                "created_at": "2022-12-18T23:06:18.993Z",
+                "title": "Из фикстуры",
+                "text": "Текст",
+                "pub_date": "2022-12-18T23:06:18Z",
+                "image": "",
+                "author": user.id,
+                "location": None,
+                "category": published_category.id,
+            },
+        },
+    ], indent=2), encoding="utf-8")
+    with CaptureQueriesContext(connection) as queries:
+        call_command("import_content", str(fixture))
+    assert not [
+        query for query in queries.captured_queries
+        if query["sql"].startswith("UPDATE") and "created_at" in query["sql"]
+    ], (
+        "Убедитесь, что временные метки записываются при вставке, без"
+        " повторного обновления строк."
+    )
+    post = Post.objects.get(pk=9001)
+    assert post.title == "Из фикстуры" and post.updated_at, (
+        "Убедитесь, что импорт читает формат фикстур `db.json` и заполняет"
+        " отсутствующие автоматические временные метки."
+    )
+    assert post.created_at.year == 2022, (
+        "Убедитесь, что импорт сохраняет время создания из файла."
+    )
+    assert Post._meta.get_field("updated_at").auto_now, (
+        "Убедитесь, что импорт не меняет настройки полей модели."
+    )
+
+
+@pytest.mark.django_db
+def test_import_ignore_conflicts_keeps_existing(
+        tmp_path, post_with_published_location):
+    post = post_with_published_location
+    dump = tmp_path / "dump.ndjson"
+    call_command("export_content", output=str(dump))
+    Post.objects.filter(pk=post.pk).update(
+        created_at=post.created_at - timedelta(days=30))
+    call_command("import_content", str(dump), ignore_conflicts=True)
+    assert Post.objects.get(pk=post.pk).created_at == (
+        post.created_at - timedelta(days=30)
+    ), (
+        "Убедитесь, что импорт с `--ignore-conflicts` не меняет уже"
+        " существующие записи."
+    )
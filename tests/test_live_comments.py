@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+from asgiref.sync import sync_to_async
+
+from blog.live import broadcaster
+from blogicum.asgi import application
+
+
+async def open_stream(post_id):
+    messages, disconnect = asyncio.Queue(), asyncio.Event()
+
+    async def receive():
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    scope = {
+        "type": "http", "method": "GET", "headers": [], "query_string": b"",
+        "path": f"/posts/{post_id}/comments/stream/",
+    }
+    task = asyncio.ensure_future(
+        application(scope, receive, messages.put))
+    return task, messages, disconnect
+
+
+@pytest.mark.django_db(transaction=True)
+def test_new_comments_pushed_to_listeners(
+        user_client, post_with_published_location):
+    post = post_with_published_location
+
+    async def scenario():
+        task, messages, disconnect = await open_stream(post.id)
+        start = await asyncio.wait_for(messages.get(), 5)
+        assert start["status"] == 200
+        assert (b"content-type", b"text/event-stream; charset=utf-8") in (
+            start["headers"])
+        await asyncio.wait_for(messages.get(), 5)
+        response = await sync_to_async(user_client.post)(
+            f"/posts/{post.id}/comment/", {"text": "Живой комментарий"})
+        assert response.status_code == 302
+        event = await asyncio.wait_for(messages.get(), 5)
+        disconnect.set()
+        await asyncio.wait_for(task, 5)
+        return event["body"].decode()
+
+    body = asyncio.run(scenario())
+    assert body.startswith("event: comment\n"), (
+        "Убедитесь, что новый комментарий отправляется подписчикам"
+        " как событие `comment`."
+    )
+    assert "data:     Живой комментарий" in body
+    assert not broadcaster.listeners, (
+        "Убедитесь, что после отключения клиента подписка удаляется."
+    )
+
+
+@pytest.mark.django_db
+def test_stream_unavailable_under_wsgi(client, post_with_published_location):
+    response = client.get(
+        f"/posts/{post_with_published_location.id}/comments/stream/")
+    assert response.status_code == 501
@@ -0,0 +1,80 @@
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from blog.constants import COMMENTS_STREAM_THRESHOLD
+from blog.models import Comment
+from core import pagecache
+
+
+@pytest.fixture
+def clean_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_overloaded_reads_get_stale_page_or_503(
+        clean_cache, client, user_client, post_with_published_location):
+    url = f"/posts/{post_with_published_location.id}/"
+    fresh = client.get(url)
+    with override_settings(LOAD_SHEDDING_LIMITS={"read": 0, "write": 8}):
+        stale = client.get(url)
+        assert stale.status_code == 200
+        assert stale.has_header("Warning"), (
+            "Убедитесь, что при перегрузке анонимным читателям отдаётся"
+            " сохранённая копия страницы."
+        )
+        assert stale.content == fresh.content
+        response = user_client.get(url)
+        assert response.status_code == 503, (
+            "Убедитесь, что при превышении лимита одновременных запросов"
+            " возвращается статус 503."
+        )
+        assert response.has_header("Retry-After")
+        response = user_client.post(
+            f"{url}comment/", {"text": "Запись не зависит от чтения"})
+        assert response.status_code == 302, (
+            "Убедитесь, что у операций записи отдельный лимит."
+        )
+
+
+@pytest.mark.django_db
+def test_overloaded_writes_rejected(
+        clean_cache, user_client, post_with_published_location):
+    url = f"/posts/{post_with_published_location.id}/"
+    with override_settings(LOAD_SHEDDING_LIMITS={"read": 32, "write": 0}):
+        assert user_client.post(
+            f"{url}comment/", {"text": "Текст"}).status_code == 503
+        assert user_client.get(url).status_code == 200
+
+
+@pytest.mark.django_db
+def test_pages_with_csrf_token_not_stored(clean_cache, client):
+    assert client.get("/auth/registration/").status_code == 200
+    assert pagecache.get_page("/auth/registration/") is None, (
+        "Убедитесь, что страницы с CSRF-токеном не сохраняются для"
+        " отдачи другим посетителям."
+    )
+
+
+@pytest.mark.django_db
+def test_streamed_response_counted_until_consumed(
+        clean_cache, user, user_client, post_with_published_location):
+    post = post_with_published_location
+    Comment.objects.bulk_create(
+        Comment(post=post, author=user, text="Комментарий")
+        for _ in range(COMMENTS_STREAM_THRESHOLD)
+    )
+    url = f"/posts/{post.id}/"
+    with override_settings(LOAD_SHEDDING_LIMITS={"read": 1, "write": 8}):
+        streamed = user_client.get(url)
+        assert streamed.streaming
+        assert user_client.get(url).status_code == 503, (
+            "Убедитесь, что потоковый ответ занимает слот, пока его тело"
+            " не отправлено."
+        )
+        b"".join(streamed.streaming_content)
+        streamed.close()
+        assert user_client.get(url).status_code == 200
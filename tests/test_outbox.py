@@ -0,0 +1,134 @@
+import threading
+import warnings
+from io import StringIO
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.core.mail.backends import locmem
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from core.mail import claim_batch, deliver_batch
+from core.models import OutboxMessage
+
+OUTBOX_SETTINGS = {
+    "EMAIL_BACKEND": "core.mail.OutboxBackend",
+    "OUTBOX_DELIVERY_BACKEND": "django.core.mail.backends.locmem.EmailBackend",
+    "OUTBOX_MAX_ATTEMPTS": 2,
+}
+
+
+@pytest.mark.django_db
+@override_settings(**OUTBOX_SETTINGS)
+def test_password_reset_queued_then_delivered(client, user):
+    user.email = "reader@example.com"
+    user.save()
+    response = client.post(
+        "/auth/password_reset/", {"email": "reader@example.com"})
+    assert response.status_code == 302
+    assert not mail.outbox, (
+        "Убедитесь, что письмо для сброса пароля не отправляется во время"
+        " запроса, а ставится в очередь."
+    )
+    queued = OutboxMessage.objects.get()
+    assert queued.status == OutboxMessage.PENDING
+    assert queued.recipients == "reader@example.com"
+
+    call_command("send_queued_mail", stdout=StringIO())
+    assert len(mail.outbox) == 1, (
+        "Убедитесь, что команда `send_queued_mail` отправляет письма"
+        " из очереди."
+    )
+    assert mail.outbox[0].subject == queued.subject
+    assert mail.outbox[0].to == ["reader@example.com"]
+    queued.refresh_from_db()
+    assert queued.status == OutboxMessage.SENT
+
+
+@pytest.mark.django_db
+@override_settings(**OUTBOX_SETTINGS)
+def test_failed_messages_retried_then_dead_lettered(monkeypatch):
+    mail.send_mail("Тема", "Текст", "from@example.com", ["to@example.com"])
+
+    def fail(self, messages):
+        raise ConnectionError("SMTP недоступен")
+
+    monkeypatch.setattr(locmem.EmailBackend, "send_messages", fail)
+    assert deliver_batch(10) == {"sent": 0, "failed": 1, "dead": 0}
+    queued = OutboxMessage.objects.get()
+    assert queued.next_attempt_at > timezone.now(), (
+        "Убедитесь, что неудачная отправка откладывается на потом."
+    )
+    assert deliver_batch(10) == {}
+    OutboxMessage.objects.update(
+        next_attempt_at=timezone.now() - timedelta(seconds=1))
+    assert deliver_batch(10) == {"sent": 0, "failed": 0, "dead": 1}
+    queued.refresh_from_db()
+    assert queued.status == OutboxMessage.DEAD, (
+        "Убедитесь, что после исчерпания попыток письмо помечается как"
+        " недоставленное."
+    )
+    assert "SMTP недоступен" in queued.last_error
+
+
+@pytest.mark.django_db
+@override_settings(**OUTBOX_SETTINGS)
+def test_messages_claimed_by_one_worker():
+    mail.send_mail("Тема", "Текст", "from@example.com", ["to@example.com"])
+    assert len(claim_batch(10)) == 1
+    assert claim_batch(10) == [], (
+        "Убедитесь, что письмо, взятое в отправку одним процессом, не"
+        " достаётся другому."
+    )
+    assert deliver_batch(10) == {}
+    assert not mail.outbox
+    OutboxMessage.objects.update(
+        next_attempt_at=timezone.now() - timedelta(seconds=1))
+    assert deliver_batch(10) == {"sent": 1, "failed": 0, "dead": 0}, (
+        "Убедитесь, что письмо, зависшее в отправке, снова берётся после"
+        " истечения срока захвата."
+    )
+    assert len(mail.outbox) == 1
+
+
+@pytest.fixture
+def smtp_sink():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        asyncore = pytest.importorskip("asyncore")
+        smtpd = pytest.importorskip("smtpd")
+    received = []
+
+    class Sink(smtpd.SMTPServer):
+        def process_message(self, peer, mailfrom, rcpttos, data, **kwargs):
+            received.append((rcpttos, data))
+
+    server = Sink(("127.0.0.1", 0), None)
+    thread = threading.Thread(
+        target=asyncore.loop, kwargs={"timeout": 0.05}, daemon=True)
+    thread.start()
+    yield server.socket.getsockname()[1], received
+    server.close()
+    thread.join(timeout=5)
+
+
+@pytest.mark.django_db
+def test_delivery_over_smtp(smtp_sink):
+    port, received = smtp_sink
+    with override_settings(**OUTBOX_SETTINGS):
+        mail.send_mail(
+            "Сброс пароля", "Ссылка", "from@example.com", ["to@example.com"])
+    with override_settings(
+            OUTBOX_DELIVERY_BACKEND=(
+                "django.core.mail.backends.smtp.EmailBackend"),
+            EMAIL_HOST="127.0.0.1", EMAIL_PORT=port,
+            EMAIL_USE_TLS=False, EMAIL_USE_SSL=False):
+        assert deliver_batch(10) == {"sent": 1, "failed": 0, "dead": 0}, (
+            "Убедитесь, что письма из очереди отправляются через SMTP."
+        )
+    assert len(received) == 1
+    recipients, data = received[0]
+    assert recipients == ["to@example.com"]
+    assert b"Subject:" in data
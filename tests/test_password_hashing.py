@@ -0,0 +1,42 @@
+import pytest
+
+from core import hashing, metrics
+
+REGISTRATION_DATA = {
+    "username": "new_reader",
+    "password1": "Sup3r-secret-pass",
+    "password2": "Sup3r-secret-pass",
+}
+
+
+@pytest.mark.django_db
+def test_registration_hashes_in_pool(client):
+    metrics.reset()
+    response = client.post("/auth/registration/", REGISTRATION_DATA)
+    assert response.status_code == 302
+    timings = metrics.snapshot()["timings"]
+    assert "auth.hashing.latency_ms" in timings, (
+        "Убедитесь, что время хеширования пароля попадает в метрики."
+    )
+    assert "auth.hashing.queue_wait_ms" in timings
+    assert client.login(username="new_reader",
+                        password="Sup3r-secret-pass")
+
+
+@pytest.mark.django_db
+def test_overloaded_pool_returns_429(client, monkeypatch):
+    pool = hashing.HashingPool(workers=1, queue_size=0)
+    monkeypatch.setattr(hashing, "_pool", pool)
+    pool.slots.acquire()
+    try:
+        response = client.post("/auth/registration/", REGISTRATION_DATA)
+        login = client.post("/auth/login/", {
+            "username": "new_reader", "password": "Sup3r-secret-pass"})
+    finally:
+        pool.slots.release()
+    assert response.status_code == 429, (
+        "Убедитесь, что при переполнении очереди хеширования паролей"
+        " возвращается статус 429."
+    )
+    assert response.has_header("Retry-After")
+    assert login.status_code == 429
@@ -0,0 +1,99 @@
+import time
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from core import metrics
+from core.ratelimit import take_tokens
+
+
+@pytest.fixture
+def tight_limits():
+    cache.clear()
+    limits = {
+        "comment": {"user": (2, 60), "ip": (10, 60)},
+        "registration": {"ip": (1, 3600)},
+    }
+    with override_settings(RATE_LIMITS=limits):
+        yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_comments_limited_per_user(
+        tight_limits, user_client, another_user_client,
+        post_with_published_location):
+    url = f"/posts/{post_with_published_location.id}/comment/"
+    metrics.reset()
+    for _ in range(2):
+        assert user_client.post(url, {"text": "Ещё"}).status_code == 302
+    response = user_client.post(url, {"text": "Лишний"})
+    assert response.status_code == 429, (
+        "Убедитесь, что при превышении лимита комментариев возвращается"
+        " статус 429."
+    )
+    assert int(response["Retry-After"]) > 0
+    assert another_user_client.post(
+        url, {"text": "Другой автор"}).status_code == 302, (
+        "Убедитесь, что лимит считается отдельно для каждого пользователя."
+    )
+    counters = metrics.snapshot()["counters"]
+    assert counters["ratelimit.comment.limited"] == 1
+    assert counters["ratelimit.comment.allowed"] == 3
+
+
+@pytest.mark.django_db
+def test_registration_limited_per_ip(tight_limits, client):
+    data = {"password1": "Sup3r-secret-pass", "password2": "Sup3r-secret-pass"}
+    response = client.post("/auth/registration/", dict(data, username="a1"))
+    assert response.status_code == 302
+    response = client.post("/auth/registration/", dict(data, username="a2"))
+    assert response.status_code == 429, (
+        "Убедитесь, что регистрация ограничена по IP-адресу."
+    )
+    assert client.get("/auth/registration/").status_code == 200
+
+
+@pytest.mark.django_db
+def test_rejected_request_does_not_consume_other_buckets(
+        user_client, post_with_published_location):
+    cache.clear()
+    limits = {"comment": {"user": (2, 60), "ip": (1, 60)}}
+    url = f"/posts/{post_with_published_location.id}/comment/"
+    with override_settings(RATE_LIMITS=limits):
+        assert user_client.post(
+            url, {"text": "Первый"}, REMOTE_ADDR="10.0.0.1"
+        ).status_code == 302
+        assert user_client.post(
+            url, {"text": "Второй"}, REMOTE_ADDR="10.0.0.1"
+        ).status_code == 429
+        response = user_client.post(
+            url, {"text": "Третий"}, REMOTE_ADDR="10.0.0.2")
+        assert response.status_code == 302, (
+            "Убедитесь, что запрос, отклонённый по лимиту IP-адреса, не"
+            " расходует лимит пользователя."
+        )
+        assert user_client.post(
+            url, {"text": "Четвёртый"}, REMOTE_ADDR="10.0.0.3"
+        ).status_code == 429
+    cache.clear()
+
+
+def test_token_bucket_refills_gradually(monkeypatch):
+    cache.clear()
+    clock = [time.time()]
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+    buckets = {"ratelimit:test:user:1": (2, 60)}
+    assert [take_tokens(buckets) for _ in range(2)] == [0, 0]
+    assert take_tokens(buckets) == 30, (
+        "Убедитесь, что `Retry-After` равен времени до появления токена."
+    )
+    clock[0] += 31
+    assert take_tokens(buckets) == 0, (
+        "Убедитесь, что токены восполняются постепенно."
+    )
+    assert take_tokens(buckets) > 0, (
+        "Убедитесь, что лимит не удваивается на границе интервала."
+    )
+    cache.clear()
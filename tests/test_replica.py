@@ -0,0 +1,67 @@
+import pytest
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.test import override_settings
+
+from blog.models import Post
+from core.routers import (PrimaryReplicaRouter, replica_reads_enabled,
+                          use_replica)
+
+
+@override_settings(REPLICA_DATABASE="replica")
+def test_router_sends_reads_to_replica_only_when_enabled():
+    router = PrimaryReplicaRouter()
+    assert router.db_for_read(Post) == "default"
+    with use_replica():
+        assert router.db_for_read(Post) == "replica", (
+            "Убедитесь, что внутри `use_replica()` чтение идёт с реплики."
+        )
+        assert router.db_for_read(Session) == "default", (
+            "Убедитесь, что сессии всегда читаются с основной базы."
+        )
+        assert router.db_for_write(Post) == "default", (
+            "Убедитесь, что запись всегда идёт в основную базу."
+        )
+
+
+@pytest.fixture
+def replica_flags(monkeypatch):
+    flags = []
+    original = PrimaryReplicaRouter.db_for_read
+
+    def spy(self, model, **hints):
+        if model is Post:
+            flags.append(replica_reads_enabled())
+        return original(self, model, **hints)
+
+    monkeypatch.setattr(PrimaryReplicaRouter, "db_for_read", spy)
+    return flags
+
+
+@pytest.mark.django_db
+def test_read_views_use_replica(
+        client, replica_flags, post_with_published_location):
+    client.get(f"/posts/{post_with_published_location.id}/")
+    client.get("/")
+    assert replica_flags and all(replica_flags), (
+        "Убедитесь, что страницы чтения выполняют запросы к публикациям"
+        " через реплику, включая отрисовку шаблона."
+    )
+
+
+@pytest.mark.django_db
+def test_comment_makes_reads_sticky_to_primary(
+        user_client, replica_flags, post_with_published_location):
+    url = f"/posts/{post_with_published_location.id}/"
+    response = user_client.post(f"{url}comment/", {"text": "Новый"})
+    cookie = response.cookies.get(settings.REPLICA_STICKY_COOKIE)
+    assert cookie and cookie["max-age"] == settings.REPLICA_STICKY_SECONDS, (
+        "Убедитесь, что после добавления комментария выставляется"
+        " короткоживущая cookie привязки к основной базе."
+    )
+    replica_flags.clear()
+    user_client.get(url)
+    assert replica_flags and not any(replica_flags), (
+        "Убедитесь, что при наличии cookie привязки чтение идёт"
+        " с основной базы."
+    )
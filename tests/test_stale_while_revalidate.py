@@ -0,0 +1,63 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core import pagecache
+
+
+@pytest.fixture
+def clean_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_homepage_served_from_cache(
+        clean_cache, client, post_with_published_location):
+    first = client.get("/")
+    assert pagecache.get_page("/") is not None, (
+        "Убедитесь, что главная страница сохраняется в кэш страниц."
+    )
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get("/")
+    assert response.content == first.content, (
+        "Убедитесь, что свежая копия главной страницы отдаётся из кэша"
+        " без выполнения основного запроса."
+    )
+    assert response["ETag"] == first["ETag"]
+    assert len(queries) == 1, (
+        "Убедитесь, что попадание в кэш стоит один запрос версии ленты."
+    )
+    sql = queries[0]["sql"]
+    assert "blog_comment" not in sql and "COUNT(" not in sql, (
+        "Убедитесь, что при попадании в кэш не пересчитываются публикации"
+        " и комментарии."
+    )
+
+
+@pytest.mark.django_db
+def test_stale_page_served_while_revalidating(
+        clean_cache, client, post_with_published_location):
+    old = client.get("/")
+    post_with_published_location.title = "Новый заголовок публикации"
+    post_with_published_location.save()
+    assert pagecache.acquire_lock("/")
+    try:
+        response = client.get("/")
+    finally:
+        pagecache.release_lock("/")
+    assert response.status_code == 200
+    assert response.content == old.content, (
+        "Убедитесь, что пока страницу пересчитывает другой процесс,"
+        " отдаётся устаревшая копия из кэша."
+    )
+    response = client.get("/")
+    assert "Новый заголовок публикации" in response.content.decode(), (
+        "Убедитесь, что после снятия блокировки страница пересчитывается."
+    )
+    assert response["ETag"] != old["ETag"]
+    assert client.get(
+        f"/category/{post_with_published_location.category.slug}/"
+    ).status_code == 200
@@ -0,0 +1,41 @@
+import gzip
+
+import pytest
+from django.core.management import call_command
+from django.templatetags.static import static
+from django.test import override_settings
+
+
+@pytest.fixture
+def collected_static(tmp_path):
+    with override_settings(STATIC_ROOT=tmp_path):
+        call_command("collectstatic", interactive=False, verbosity=0)
+        yield tmp_path
+
+
+def test_hashed_assets_precompressed(collected_static, client):
+    url = static("css/bootstrap.min.css")
+    assert url != "/static/css/bootstrap.min.css", (
+        "Убедитесь, что статические файлы получают имена с хешем"
+        " содержимого."
+    )
+    compressed = collected_static / (url[len("/static/"):] + ".gz")
+    assert compressed.exists(), (
+        "Убедитесь, что при collectstatic рядом с файлом создаётся"
+        " сжатая `.gz`-копия."
+    )
+    response = client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+    assert response["Content-Encoding"] == "gzip"
+    assert "immutable" in response["Cache-Control"], (
+        "Убедитесь, что файлы с хешем отдаются с неизменяемым"
+        " `Cache-Control`."
+    )
+    body = gzip.decompress(b"".join(response.streaming_content))
+    assert body == (collected_static / url[len("/static/"):]).read_bytes()
+
+
+def test_unhashed_assets_short_cache(collected_static, client):
+    response = client.get("/static/css/bootstrap.min.css")
+    assert response.status_code == 200
+    assert "immutable" not in response["Cache-Control"]
+    assert not response.has_header("Content-Encoding")
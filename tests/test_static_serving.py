@@ -0,0 +1,78 @@
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+
+
+@pytest.fixture
+def collected_static(tmp_path):
+    with override_settings(STATIC_ROOT=tmp_path / "static"):
+        call_command("collectstatic", interactive=False, verbosity=0)
+        yield tmp_path / "static"
+
+
+@pytest.fixture
+def media_file(tmp_path):
+    root = tmp_path / "media"
+    (root / "post_images").mkdir(parents=True)
+    path = root / "post_images" / "picture.jpg"
+    path.write_bytes(bytes(range(256)) * 4)
+    with override_settings(MEDIA_ROOT=root):
+        yield path
+
+
+def test_static_range_request(collected_static, client):
+    url = "/static/css/bootstrap.min.css"
+    content = (collected_static / "css" / "bootstrap.min.css").read_bytes()
+    response = client.get(url, HTTP_RANGE="bytes=10-19")
+    assert response.status_code == 206, (
+        "Убедитесь, что на запрос с заголовком `Range` статический файл"
+        " отдаётся частично со статусом 206."
+    )
+    assert response["Content-Length"] == "10"
+    assert response["Content-Range"] == f"bytes 10-19/{len(content)}"
+    assert b"".join(response.streaming_content) == content[10:20]
+
+    response = client.get(url, HTTP_RANGE="bytes=-5")
+    assert b"".join(response.streaming_content) == content[-5:]
+
+    response = client.get(url, HTTP_RANGE=f"bytes={len(content)}-")
+    assert response.status_code == 416, (
+        "Убедитесь, что для недопустимого диапазона возвращается"
+        " статус 416."
+    )
+
+    response = client.get(url, HTTP_RANGE="bytes=-0")
+    assert response.status_code == 416, (
+        "Убедитесь, что для пустого суффиксного диапазона возвращается"
+        " статус 416."
+    )
+
+
+def test_static_not_modified(collected_static, client):
+    url = "/static/css/bootstrap.min.css"
+    response = client.get(url)
+    assert response["Content-Length"] == str(
+        (collected_static / "css" / "bootstrap.min.css").stat().st_size)
+    response = client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+    assert response.status_code == 304, (
+        "Убедитесь, что при совпадении `ETag` статический файл не"
+        " передаётся повторно."
+    )
+    response = client.head(url)
+    assert response.status_code == 200
+    assert response.content == b""
+
+
+def test_media_served(media_file, client):
+    response = client.get("/media/post_images/picture.jpg")
+    assert response.status_code == 200, (
+        "Убедитесь, что загруженные изображения отдаются по `MEDIA_URL`."
+    )
+    assert response["Content-Type"] == "image/jpeg"
+    assert b"".join(response.streaming_content) == media_file.read_bytes()
+    response = client.get("/media/post_images/picture.jpg",
+                          HTTP_RANGE="bytes=1000-")
+    assert b"".join(response.streaming_content) == (
+        media_file.read_bytes()[1000:])
+    response = client.get("/media/../settings.py")
+    assert response.status_code == 404
@@ -0,0 +1,50 @@
+import re
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from blog.constants import COMMENTS_STREAM_THRESHOLD
+from blog.models import Comment
+
+
+@pytest.mark.django_db
+def test_long_threads_streamed(
+        user, user_client, post_with_published_location):
+    post = post_with_published_location
+    Comment.objects.bulk_create(
+        Comment(post=post, author=user, text=f"Комментарий №{number}")
+        for number in range(COMMENTS_STREAM_THRESHOLD + 10)
+    )
+    response = user_client.get(f"/posts/{post.id}/")
+    assert response.streaming, (
+        "Убедитесь, что страница поста с длинной веткой комментариев"
+        " отдаётся потоковым ответом."
+    )
+    with CaptureQueriesContext(connection) as queries:
+        chunks = [chunk.decode() for chunk in response.streaming_content]
+    assert any("blog_comment" in query["sql"] for query in queries), (
+        "Убедитесь, что комментарии загружаются из базы данных по мере"
+        " отправки ответа, а не до отправки первого фрагмента."
+    )
+    assert "</head>" in chunks[0] and post.title in chunks[0], (
+        "Убедитесь, что `<head>` и текст поста отправляются первым"
+        " фрагментом, до комментариев."
+    )
+    assert "Комментарий" not in chunks[0]
+    assert len(chunks) > 2
+    content = "".join(chunks)
+    numbers = [int(number) for number in re.findall(r"№(\d+)", content)]
+    assert numbers == list(range(COMMENTS_STREAM_THRESHOLD + 10)), (
+        "Убедитесь, что в потоковом ответе выводятся все комментарии"
+        " в порядке добавления."
+    )
+    assert "Отредактировать комментарий" in content
+    assert content.rstrip().endswith("</html>")
+
+
+@pytest.mark.django_db
+def test_short_threads_rendered(client, comment_to_a_post):
+    response = client.get(f"/posts/{comment_to_a_post.post.id}/")
+    assert not response.streaming
+    assert f"comment_{comment_to_a_post.id}" in response.content.decode()
@@ -0,0 +1,80 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from blog.models import Comment, Post
+from blog.trending import update_trending
+
+
+@pytest.fixture
+def clean_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_popular_feed_ordered_by_trending_score(
+        clean_cache, client, user, many_posts_with_published_locations):
+    hot, warm = many_posts_with_published_locations[:2]
+    Post.objects.filter(pk__in=(hot.pk, warm.pk)).update(
+        pub_date=timezone.now() - timedelta(hours=1))
+    for post, count in ((hot, 3), (warm, 1)):
+        for _ in range(count):
+            Comment.objects.create(text="Комментарий", post=post, author=user)
+    assert update_trending() == 2
+    response = client.get("/popular/")
+    assert response.status_code == 200
+    assert "includes/post_card.html" in (
+        template.name for template in response.templates), (
+        "Убедитесь, что лента популярного использует шаблон"
+        " `includes/post_card.html`."
+    )
+    assert list(response.context["page_obj"]) == [hot, warm], (
+        "Убедитесь, что лента популярного упорядочена по рейтингу и"
+        " содержит только обсуждаемые публикации."
+    )
+
+
+@pytest.mark.django_db
+def test_trending_updated_incrementally(
+        clean_cache, user, many_posts_with_published_locations):
+    post = many_posts_with_published_locations[0]
+    Post.objects.filter(pk=post.pk).update(pub_date=timezone.now())
+    Comment.objects.create(text="Комментарий", post=post, author=user)
+    update_trending()
+    score = Post.objects.get(pk=post.pk).trending_score
+    assert score > 0
+    assert update_trending(
+        timezone.now() + timedelta(hours=1)) == 1, (
+        "Убедитесь, что при пересчёте рейтинга обновляются только"
+        " публикации, уже попавшие в рейтинг или получившие комментарии."
+    )
+    assert Post.objects.get(pk=post.pk).trending_score < score, (
+        "Убедитесь, что рейтинг публикации снижается с возрастом."
+    )
+    assert update_trending(timezone.now() + timedelta(days=30)) == 1
+    assert Post.objects.get(pk=post.pk).trending_score == 0
+
+
+@pytest.mark.django_db
+def test_popular_etag_follows_scores(
+        clean_cache, client, user, many_posts_with_published_locations):
+    post = many_posts_with_published_locations[0]
+    Post.objects.filter(pk=post.pk).update(pub_date=timezone.now())
+    Comment.objects.create(text="Комментарий", post=post, author=user)
+    update_trending()
+    etag = client.get("/popular/")["ETag"]
+    assert client.get(
+        "/popular/", HTTP_IF_NONE_MATCH=etag).status_code == 304
+    cache.clear()
+    update_trending(timezone.now() + timedelta(hours=1))
+    cache.clear()
+    response = client.get("/popular/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200, (
+        "Убедитесь, что `ETag` ленты популярного меняется после пересчёта"
+        " рейтинга в отдельном процессе."
+    )
+    assert not response.has_header("Last-Modified")
@@ -0,0 +1,100 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import OperationalError, connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from blog import views, viewcounts
+from blog.models import Post
+from blog.trending import update_trending
+from blog.viewcounts import (ViewCountBuffer, flush_spool, locked_spool,
+                             write_spool)
+
+
+@pytest.fixture
+def view_counts(settings, monkeypatch):
+    cache.clear()
+    settings.VIEW_COUNTS_FLUSH_INTERVAL = 3600
+    buffer = ViewCountBuffer()
+    monkeypatch.setattr(views, "view_counts", buffer)
+    yield buffer
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_views_counted_without_per_request_writes(
+        view_counts, client, post_with_published_location):
+    post = post_with_published_location
+    url = f"/posts/{post.id}/"
+    with CaptureQueriesContext(connection) as queries:
+        for _ in range(3):
+            assert client.get(url).status_code == 200
+    assert not any(
+        query["sql"].startswith("UPDATE") for query in queries), (
+        "Убедитесь, что просмотр публикации не записывается в базу данных"
+        " при каждом запросе."
+    )
+    post.refresh_from_db()
+    assert post.views_count == 0
+    assert view_counts.flush() == 1
+    post.refresh_from_db()
+    assert post.views_count == 3, (
+        "Убедитесь, что накопленные просмотры сохраняются при сбросе"
+        " буфера."
+    )
+
+
+@pytest.mark.django_db
+def test_spool_flushed_once_across_workers(
+        view_counts, post_with_published_location):
+    post = post_with_published_location
+    Post.objects.filter(pk=post.pk).update(
+        pub_date=timezone.now() - timedelta(hours=1))
+    write_spool({post.id: 4})
+    write_spool({post.id: 2})
+    with locked_spool():
+        assert flush_spool() == 0, (
+            "Убедитесь, что спул-файл не сбрасывается, пока его"
+            " обрабатывает другой процесс."
+        )
+    call_command("flush_view_counts", stdout=StringIO())
+    assert flush_spool() == 0
+    post.refresh_from_db()
+    assert post.views_count == 6
+    cache.clear()
+    assert update_trending() == 1
+    post.refresh_from_db()
+    assert post.trending_score > 0, (
+        "Убедитесь, что просмотры учитываются в рейтинге популярности,"
+        " даже если рейтинг пересчитывается в отдельном процессе."
+    )
+    assert not post.views_pending
+
+
+@pytest.mark.django_db
+def test_failed_flush_keeps_counts(
+        view_counts, settings, monkeypatch, client,
+        post_with_published_location):
+    post = post_with_published_location
+
+    def locked_database(counts):
+        raise OperationalError("database is locked")
+
+    settings.VIEW_COUNTS_FLUSH_INTERVAL = 0
+    monkeypatch.setattr(viewcounts, "apply_counts", locked_database)
+    response = client.get(f"/posts/{post.id}/")
+    assert response.status_code == 200, (
+        "Убедитесь, что ошибка при сбросе счётчиков просмотров не ломает"
+        " страницу публикации."
+    )
+    monkeypatch.undo()
+    assert flush_spool() == 1
+    post.refresh_from_db()
+    assert post.views_count == 1, (
+        "Убедитесь, что после неудачного сброса просмотры остаются"
+        " в спул-файле."
+    )
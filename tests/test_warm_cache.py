@@ -0,0 +1,52 @@
+from io import StringIO
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+
+from blog.constants import COMMENTS_STREAM_THRESHOLD
+from blog.models import Comment, Post
+from blog.viewcounts import buffer as view_counts
+from blog.warmup import get_top_posts
+from core import pagecache
+
+
+@pytest.fixture
+def clean_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_warm_cache_fills_server_page_cache(
+        clean_cache, live_server, user, many_posts_with_published_locations,
+        published_category):
+    streamed, viewed = many_posts_with_published_locations[:2]
+    Post.objects.filter(pk=streamed.pk).update(views_count=100)
+    Post.objects.filter(pk=viewed.pk).update(views_count=50)
+    Comment.objects.bulk_create(
+        Comment(post=streamed, author=user, text="Комментарий")
+        for _ in range(COMMENTS_STREAM_THRESHOLD)
+    )
+    assert list(get_top_posts(1)) == [viewed.pk], (
+        "Убедитесь, что для прогрева выбираются самые просматриваемые"
+        " публикации, страницы которых можно закэшировать."
+    )
+    stdout = StringIO()
+    call_command("warm_cache", "--url", live_server.url, "--pages", "5",
+                 "--posts", "1", "--workers", "3", stdout=stdout)
+    category_url = f"/category/{published_category.slug}/"
+    for url in ("/", "/?page=2", category_url, f"{category_url}?page=2"):
+        assert pagecache.get_page(url) is not None, (
+            "Убедитесь, что команда `warm_cache` прогревает кэш запущенного"
+            f" сервера: не найдена страница {url}."
+        )
+    assert pagecache.get_page("/?page=3") is None, (
+        "Убедитесь, что команда `warm_cache` не запрашивает пустые страницы."
+    )
+    assert pagecache.get_page(f"/posts/{viewed.id}/") is not None
+    assert "Прогрето страниц: 5 из 5" in stdout.getvalue()
+    assert viewed.id not in view_counts.counts, (
+        "Убедитесь, что запросы прогрева не учитываются как просмотры."
+    )